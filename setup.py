@@ -48,6 +48,7 @@ setup(
             "isort >= 5.1.2",
             "pytest >= 6.0.0rc1",
             "pytest-cov >= 2.7.1",
+            "pytest-xdist >= 2.0.0",
             "sphinx >= 3.1.2",
             "sphinx-tabs >= 1.1.13",
             "sphinx_rtd_theme >= 0.5.0",
@@ -19,7 +19,9 @@ class EarlyStopping(Callback):
         stopped when the metric being monitored or the ELBO stops decreasing.
     patience : int
         Number of epochs to allow training to continue even if metric is not
-        decreasing.  Default is 0.
+        decreasing.  Epochs where a :class:`.MonitorMetric` with
+        ``interval > 1`` didn't evaluate the metric are skipped, so for those
+        this is a number of evaluations.  Default is 0.
     restore_best_weights : bool
         Whether or not to restore the weights from the best epoch after
         training is stopped.  Default = False.
@@ -66,6 +68,8 @@ class EarlyStopping(Callback):
         """Stop training if there was no improvement since the last epoch."""
         self.epoch += 1
         if isinstance(self.metric_fn, MonitorMetric):
+            if not self.metric_fn.updated:
+                return
             metric = self.metric_fn.current_metric
         elif isinstance(self.metric_fn, MonitorELBO):
             metric = self.metric_fn.current_elbo
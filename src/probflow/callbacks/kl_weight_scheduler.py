@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-
 from .callback import Callback
 
 
@@ -57,6 +55,9 @@ class KLWeightScheduler(Callback):
         **kwargs
             Additional keyword arguments are passed to plt.plot
         """
+
+        import matplotlib.pyplot as plt
+
         plt.plot(self.epochs, self.kl_weights, **kwargs)
         plt.xlabel("Epoch")
         plt.ylabel("KL Loss Weight")
@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-
 from .callback import Callback
 
 
@@ -60,6 +58,9 @@ class LearningRateScheduler(Callback):
         **kwargs
             Additional keyword arguments are passed to matplotlib.pyplot.plot
         """
+
+        import matplotlib.pyplot as plt
+
         plt.plot(self.epochs, self.learning_rate, **kwargs)
         plt.xlabel("Epoch")
         plt.ylabel("Learning Rate")
@@ -1,6 +1,5 @@
 import time
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from .callback import Callback
@@ -63,6 +62,9 @@ class MonitorELBO(Callback):
         **kwargs
             Additional keyword arguments are passed to plt.plot
         """
+
+        import matplotlib.pyplot as plt
+
         if x == "time":
             plt.plot(self.wall_times, self.elbos, **kwargs)
             plt.xlabel("Time (s)")
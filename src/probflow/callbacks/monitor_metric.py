@@ -1,14 +1,39 @@
 import time
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from probflow.data import make_generator
+from probflow.data import ArrayDataGenerator, DataGenerator, make_generator
+from probflow.utils.casting import to_backend_tensor
 from probflow.utils.metrics import get_metric_fn
 
 from .callback import Callback
 
 
+class _TensorDataGenerator(DataGenerator):
+    """Data generator which holds the batches of another data generator
+    as backend tensors"""
+
+    def __init__(self, data):
+        super().__init__()
+        self._n_samples = data.n_samples
+        self._batch_size = data.batch_size
+        self._batches = [
+            tuple(None if e is None else to_backend_tensor(e) for e in b)
+            for b in data
+        ]
+
+    @property
+    def n_samples(self):
+        return self._n_samples
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    def get_batch(self, index):
+        return self._batches[index]
+
+
 class MonitorMetric(Callback):
     """Monitor some metric on validation data
 
@@ -27,6 +52,13 @@ class MonitorMetric(Callback):
     verbose : bool
         Whether to print the average ELBO at the end of every training epoch
         (if True) or not (if False).  Default = False
+    interval : int
+        Compute the metric only every ``interval`` epochs (and at the end of
+        training), instead of after every epoch.  Each evaluation requires a
+        full pass over the validation data, so larger values make training
+        faster when the per-epoch values aren't needed.
+        :class:`.EarlyStopping` skips the epochs in between evaluations, so
+        its ``patience`` counts evaluations rather than epochs.  Default = 1
 
 
     Example
@@ -35,7 +67,13 @@ class MonitorMetric(Callback):
     See the user guide section on :ref:`monitoring-a-metric`.
     """
 
-    def __init__(self, metric, x, y=None, verbose=False):
+    def __init__(self, metric, x, y=None, verbose=False, interval=1):
+
+        # Check types
+        if not isinstance(interval, int):
+            raise TypeError("interval must be an int")
+        if interval < 1:
+            raise ValueError("interval must be positive")
 
         # Store metric
         self.metric_fn = get_metric_fn(metric)
@@ -50,9 +88,11 @@ class MonitorMetric(Callback):
         # Store metrics and epochs
         self.current_metric = np.nan
         self.current_epoch = 0
+        self.updated = False
         self.metrics = []
         self.epochs = []
         self.verbose = verbose
+        self.interval = interval
         self.start_time = None
         self.wall_times = []
 
@@ -61,10 +101,37 @@ class MonitorMetric(Callback):
         if self.start_time is None:
             self.start_time = time.time()
 
+    def on_train_start(self):
+        """Convert the validation data to backend tensors once, instead of
+        converting (and copying it to the device) every epoch"""
+        if (
+            isinstance(self.data, ArrayDataGenerator)
+            and self.data.num_workers is None
+            and all(
+                e is None or isinstance(e, np.ndarray)
+                for e in (self.data.x, self.data.y)
+            )
+        ):
+            self.data = _TensorDataGenerator(self.data)
+
     def on_epoch_end(self):
         """Compute the metric on validation data at the end of each epoch."""
-        self.current_metric = self.model.metric(self.metric_fn, self.data)
         self.current_epoch += 1
+        self.updated = False
+        if self.current_epoch % self.interval == 0:
+            self._evaluate()
+
+    def on_train_end(self):
+        """Compute the metric for the last epoch if it was skipped"""
+        if self.current_epoch > 0 and (
+            not self.epochs or self.epochs[-1] != self.current_epoch
+        ):
+            self._evaluate()
+
+    def _evaluate(self):
+        """Compute and record the metric on the validation data"""
+        self.current_metric = self.model.metric(self.metric_fn, self.data)
+        self.updated = True
         self.metrics += [self.current_metric]
         self.epochs += [self.current_epoch]
         self.wall_times += [time.time() - self.start_time]
@@ -86,6 +153,9 @@ class MonitorMetric(Callback):
         **kwargs
             Additional keyword arguments are passed to plt.plot
         """
+
+        import matplotlib.pyplot as plt
+
         if x == "time":
             plt.plot(self.wall_times, self.metrics, **kwargs)
             plt.xlabel("Time (s)")
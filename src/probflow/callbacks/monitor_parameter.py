@@ -1,4 +1,5 @@
-import matplotlib.pyplot as plt
+import probflow.utils.ops as O
+from probflow.utils.casting import to_numpy
 
 from .callback import Callback
 
@@ -24,18 +25,62 @@ class MonitorParameter(Callback):
 
         # Store metrics and epochs
         self.params = params
-        self.current_params = None
         self.current_epoch = 0
-        self.parameter_values = []
         self.epochs = []
+        self._tensor_values = []  # not yet converted to numpy
+        self._numpy_values = []
+        self._monitored = None  # the monitored Parameter object(s)
+
+    def on_train_start(self):
+        """Look up the Parameter(s) to monitor once at the start of training,
+        rather than searching the model's parameters every epoch."""
+        self._monitored = self.model._param_data(self.params, lambda p: p)
 
     def on_epoch_end(self):
-        """Store mean values of Parameter(s) at the end of each epoch."""
-        self.current_params = self.model.posterior_mean(self.params)
+        """Store mean values of Parameter(s) at the end of each epoch.
+
+        The values are kept as backend tensors and are only copied to
+        |ndarrays| when accessed, instead of forcing a device-to-host copy at
+        the end of every epoch.
+        """
+        if self._monitored is None:
+            self.on_train_start()
+        if isinstance(self._monitored, dict):
+            values = {
+                k: O.copy_tensor(p()) for k, p in self._monitored.items()
+            }
+        else:
+            values = O.copy_tensor(self._monitored())
+        self._tensor_values += [values]
         self.current_epoch += 1
-        self.parameter_values += [self.current_params]
         self.epochs += [self.current_epoch]
 
+    @property
+    def parameter_values(self):
+        """Mean value(s) of the Parameter(s) at the end of each epoch"""
+        pending = self._tensor_values
+        if len(pending) > 0:
+            # One device-to-host copy per parameter for all pending epochs
+            if isinstance(pending[0], dict):
+                stacked = {
+                    k: to_numpy(O.stack([v[k] for v in pending]))
+                    for k in pending[0]
+                }
+                self._numpy_values += [
+                    {k: e[i] for k, e in stacked.items()}
+                    for i in range(len(pending))
+                ]
+            else:
+                self._numpy_values += list(to_numpy(O.stack(pending)))
+            self._tensor_values = []
+        return self._numpy_values
+
+    @property
+    def current_params(self):
+        """Mean value(s) of the Parameter(s) at the end of the last epoch"""
+        values = self.parameter_values
+        return values[-1] if len(values) > 0 else None
+
     def plot(self, param=None, **kwargs):
         """Plot the parameter value(s) as a function of epoch
 
@@ -46,6 +91,9 @@ class MonitorParameter(Callback):
             parameter and plots that.  If a str, plots the parameter with that
             name (assuming we've been monitoring it).
         """
+
+        import matplotlib.pyplot as plt
+
         if param is None:  # assume we've only been monitoring one parameter
             plt.plot(self.epochs, self.parameter_values, **kwargs)
             plt.xlabel("Epoch")
@@ -1,9 +1,32 @@
 import numpy as np
 import pandas as pd
 
+from probflow.utils.settings import get_backend
+
 from .data_generator import DataGenerator
 
 
+def _sample_indexer(data):
+    """Get a function which takes samples (along the first dimension) from
+    an |ndarray|, |DataFrame|, |Series|, or TensorFlow tensor, or None if
+    there is no data"""
+    if data is None:
+        return None
+    elif isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc.__getitem__
+    elif isinstance(data, np.ndarray):
+        return data.__getitem__
+    else:
+        import tensorflow as tf
+
+        def take(ix):
+            if isinstance(ix, slice):
+                return data[ix]
+            return tf.gather(data, ix)
+
+        return take
+
+
 class ArrayDataGenerator(DataGenerator):
     """Generate array-structured data to feed through a model.
 
@@ -27,6 +50,12 @@ class ArrayDataGenerator(DataGenerator):
     testing : bool
         Whether to treat data as testing data (allow no dependent variable).
         Default = ``False``
+    drop_last : bool
+        Whether to drop the last batch of each epoch if it contains fewer than
+        ``batch_size`` samples, so that all batches have the same shape.
+        Raises a ValueError if this would leave no batches (i.e. if
+        ``batch_size`` is larger than the number of samples).
+        Default = ``False``
     """
 
     def __init__(
@@ -37,6 +66,7 @@ class ArrayDataGenerator(DataGenerator):
         shuffle=False,
         test=False,
         num_workers=None,
+        drop_last=False,
     ):
 
         # Set number of worker threads
@@ -57,6 +87,9 @@ class ArrayDataGenerator(DataGenerator):
             raise TypeError("shuffle must be True or False")
         if not isinstance(test, bool):
             raise TypeError("test must be True or False")
+        if not isinstance(drop_last, bool):
+            raise TypeError("drop_last must be True or False")
+        self.drop_last = drop_last
 
         # No data? (eg when sampling from a generative model)
         if x is None and y is None:
@@ -83,15 +116,24 @@ class ArrayDataGenerator(DataGenerator):
         else:
             self._n_samples = x.shape[0]
 
+        # Dropping the last partial batch shouldn't leave no batches at all
+        if drop_last and self._n_samples < (batch_size or 1):
+            raise ValueError(
+                "drop_last=True would leave no batches: batch_size is larger "
+                "than the number of samples"
+            )
+
         # Batch size
         if batch_size is None or self._n_samples < batch_size:
             self._batch_size = self._n_samples
         else:
             self._batch_size = batch_size
 
-        # Store references to data
+        # Store references to data, and how to take samples from each
         self.x = x
         self.y = y
+        self._take_x = _sample_indexer(x)
+        self._take_y = _sample_indexer(y)
 
         # Shuffle data
         self.shuffle = shuffle
@@ -107,6 +149,13 @@ class ArrayDataGenerator(DataGenerator):
         """Number of samples to generate each minibatch"""
         return self._batch_size
 
+    def __len__(self):
+        """Number of batches per epoch"""
+        if self.drop_last:
+            return self.n_samples // self.batch_size
+        else:
+            return super().__len__()
+
     def get_batch(self, index):
         """Generate one batch of data"""
 
@@ -119,28 +168,105 @@ class ArrayDataGenerator(DataGenerator):
         if self.shuffle:
             ix = self.ids[ix]
 
-        # Get x data
+        # Get x and y data
+        x = None if self._take_x is None else self._take_x(ix)
+        y = None if self._take_y is None else self._take_y(ix)
+        return x, y
+
+    def tf_dataset(self, repeat=False, device=None):
+        """Get a ``tf.data.Dataset`` which generates batches of this data
+
+        The dataset shuffles (if ``shuffle`` is True) and batches the data
+        within the TensorFlow runtime, and prefetches the next batch while the
+        current one is being used, instead of slicing the arrays in Python for
+        each batch.  Each element is an ``(x, y)`` tuple, or just ``y`` if
+        there is no ``x`` data.  Only available when using the TensorFlow
+        backend with data stored in |ndarrays|.
+
+        Parameters
+        ----------
+        repeat : bool
+            Whether to repeat the epochs indefinitely, so that a single
+            iterator can be used for the whole of training and batches from
+            the next epoch are prepared before the current epoch ends.  Each
+            epoch is still shuffled and batched separately.  Default = False
+        device : None or str
+            Device (e.g. ``'/GPU:0'``) to prefetch batches onto, so the next
+            batch has already been copied to the device when the current
+            training step finishes.  Default = None (i.e., prefetch batches
+            in host memory)
+
+        Returns
+        -------
+        dataset : ``tf.data.Dataset``
+            Dataset which generates one epoch of batches per iteration (or
+            batches from all epochs, if ``repeat`` is True)
+        """
+
+        # Check the data can be used in a tf.data pipeline
+        if get_backend() != "tensorflow":
+            raise RuntimeError("tf_dataset requires the TensorFlow backend")
+        if self._empty:
+            raise RuntimeError("no data to create a dataset from")
+        if any(
+            isinstance(e, (pd.DataFrame, pd.Series)) for e in (self.x, self.y)
+        ):
+            raise TypeError("tf_dataset requires data stored in ndarrays")
+
+        import tensorflow as tf
+
+        # Create the pipeline
         if self.x is None:
-            x = None
-        elif isinstance(self.x, pd.DataFrame):
-            x = self.x.iloc[ix, :]
-        elif isinstance(self.x, pd.Series):
-            x = self.x.iloc[ix]
-        else:
-            x = self.x[ix, ...]
-
-        # Get y data
-        if self.y is None:
-            y = None
-        elif isinstance(self.y, pd.DataFrame):
-            y = self.y.iloc[ix, :]
-        elif isinstance(self.y, pd.Series):
-            y = self.y.iloc[ix]
+            ds = tf.data.Dataset.from_tensor_slices(self.y)
         else:
-            y = self.y[ix, ...]
+            ds = tf.data.Dataset.from_tensor_slices((self.x, self.y))
+        if self.shuffle:
+            ds = ds.shuffle(self.n_samples, reshuffle_each_iteration=True)
+        ds = ds.batch(self.batch_size, drop_remainder=self.drop_last)
+        if repeat:
+            ds = ds.repeat()
+        if device is not None:
+            return ds.apply(tf.data.experimental.prefetch_to_device(device))
+        return ds.prefetch(tf.data.experimental.AUTOTUNE)
 
-        # Return both x and y
-        return x, y
+    def to_device(self, device=None):
+        """Copy the data to a device once, and take batches from it there
+
+        After calling this, batches are sliced (or, if ``shuffle`` is True,
+        gathered) from tensors which are stored on the device, instead of
+        being copied from host memory for every batch.  Only available when
+        using the TensorFlow backend with data stored in |ndarrays|, and the
+        data has to fit in the device's memory.
+
+        Parameters
+        ----------
+        device : None or str
+            Device (e.g. ``'/GPU:0'``) to store the data on.  Default = None
+            (i.e., the first GPU if there is one, otherwise the CPU)
+        """
+
+        # Check the data can be stored as tensors
+        if get_backend() != "tensorflow":
+            raise RuntimeError("to_device requires the TensorFlow backend")
+        if self._empty:
+            raise RuntimeError("no data to copy to the device")
+        if not all(
+            e is None or isinstance(e, np.ndarray) for e in (self.x, self.y)
+        ):
+            raise TypeError("to_device requires data stored in ndarrays")
+
+        import tensorflow as tf
+
+        # Copy the data to the device
+        if device is None:
+            gpus = tf.config.list_logical_devices("GPU")
+            device = gpus[0].name if len(gpus) > 0 else "/CPU:0"
+        with tf.device(device):
+            if self.x is not None:
+                self.x = tf.identity(self.x)
+            self.y = tf.identity(self.y)
+        self._take_x = _sample_indexer(self.x)
+        self._take_y = _sample_indexer(self.y)
 
     def on_epoch_end(self):
         """Shuffle data each epoch"""
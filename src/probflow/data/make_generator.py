@@ -9,6 +9,7 @@ def make_generator(
     shuffle=False,
     test=False,
     num_workers=None,
+    drop_last=False,
 ):
     """Make input a DataGenerator if not already"""
     if isinstance(x, DataGenerator):
@@ -21,5 +22,6 @@ def make_generator(
             test=test,
             shuffle=shuffle,
             num_workers=num_workers,
+            drop_last=drop_last,
         )
         return dg
@@ -1,8 +1,3 @@
-import matplotlib.pyplot as plt
-import numpy as np
-
-from probflow.utils.plotting import plot_categorical_dist
-
 from .model import Model
 
 
@@ -82,6 +77,10 @@ class CategoricalModel(Model):
             :func:`.plot_categorical_dist`
         """
 
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import plot_categorical_dist
+
         # Sample from the predictive distribution
         samples = self.predictive_sample(x, n=n, batch_size=batch_size)
 
@@ -96,7 +95,7 @@ class CategoricalModel(Model):
             samples = samples.reshape([Ns, N])
 
         # Plot the predictive distributions
-        rows = np.ceil(N / cols)
+        rows = -(-N // cols)
         for i in range(N):
             plt.subplot(rows, cols, i + 1)
             plot_categorical_dist(samples[:, i])
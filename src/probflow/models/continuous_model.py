@@ -1,13 +1,53 @@
-import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 
 from probflow.data import DataGenerator, make_generator
 from probflow.utils.casting import to_numpy
-from probflow.utils.plotting import plot_by, plot_dist
 
 from .model import Model
 
 
+def _x_by_values(x_by, x):
+    """Get the values of the column(s) ``x_by`` of ``x``, or ``x_by`` itself
+    if it is already an array of values"""
+
+    # Already an array of values to bin by?
+    cols = x_by if isinstance(x_by, list) else [x_by]
+    if not all(isinstance(c, (int, str)) for c in cols):
+        return x_by
+
+    # Column names can only be used w/ DataFrames
+    if isinstance(x, pd.DataFrame):
+        ix = [c if isinstance(c, int) else x.columns.get_loc(c) for c in cols]
+        return x.iloc[:, ix].values
+    elif any(isinstance(c, str) for c in cols):
+        raise TypeError(
+            "x_by can only contain column names if x is a DataFrame"
+        )
+    elif isinstance(x, DataGenerator):
+        raise TypeError(
+            "x_by must be an array of values if x is a DataGenerator"
+        )
+    x = to_numpy(x)
+    return x.reshape(-1, 1)[:, cols] if x.ndim == 1 else x[:, cols]
+
+
+def _hdi(samples, ci):
+    """Highest density intervals of samples (along the first axis)
+
+    The narrowest interval which contains a ``ci`` proportion of the samples
+    (found by sliding a window over the sorted samples).
+    """
+    n = samples.shape[0]
+    k = min(int(np.floor(ci * n)), n - 1)  # samples spanned by interval
+    samples = np.sort(samples, axis=0)
+    widths = samples[k:] - samples[: n - k]
+    ix = np.expand_dims(np.argmin(widths, axis=0), 0)
+    lb = np.take_along_axis(samples, ix, axis=0)[0]
+    ub = np.take_along_axis(samples, ix + k, axis=0)[0]
+    return lb, ub
+
+
 class ContinuousModel(Model):
     """Abstract base class for probflow models where the dependent variable
     (the target) is continuous and 1-dimensional.
@@ -100,7 +140,9 @@ class ContinuousModel(Model):
                     x, test=True, batch_size=batch_size
                 )
             ]
-            return (np.concatenate(e, axis=0) for e in zip(*intervals))
+            if side in ("lower", "upper"):
+                return np.concatenate(intervals, axis=0)
+            return tuple(np.concatenate(e, axis=0) for e in zip(*intervals))
 
         # No batching (or this is a batch)
         samples = fn(x, n=n)
@@ -108,6 +150,8 @@ class ContinuousModel(Model):
             return np.percentile(samples, 100 * (1.0 - ci), axis=0)
         elif side == "upper":
             return np.percentile(samples, 100 * ci, axis=0)
+        elif side == "hdi":
+            return _hdi(samples, ci)
         else:
             lb = 100 * (1.0 - ci) / 2.0
             prcs = np.percentile(samples, [lb, 100.0 - lb], axis=0)
@@ -133,12 +177,15 @@ class ContinuousModel(Model):
             Inner proportion of predictive distribution to use a the
             confidence interval.
             Default = 0.95
-        side : str {'lower', 'upper', 'both'}
+        side : str {'lower', 'upper', 'both', 'hdi'}
             Whether to get the one- or two-sided interval, and which side to
             get.  If ``'both'`` (default), gets the upper and lower bounds of
             the central ``ci`` interval.  If ``'lower'``, gets the lower bound
             on the one-sided ``ci`` interval.  If ``'upper'``, gets the upper
-            bound on the one-sided ``ci`` interval.
+            bound on the one-sided ``ci`` interval.  If ``'hdi'``, gets the
+            upper and lower bounds of the highest density ``ci`` interval
+            (the narrowest interval containing ``ci`` of the samples, which
+            is tighter than the central interval for skewed distributions).
         n : int
             Number of samples from the posterior predictive distribution to
             take to compute the confidence intervals.
@@ -179,12 +226,15 @@ class ContinuousModel(Model):
             Inner proportion of predictive distribution to use a the
             confidence interval.
             Default = 0.95
-        side : str {'lower', 'upper', 'both'}
+        side : str {'lower', 'upper', 'both', 'hdi'}
             Whether to get the one- or two-sided interval, and which side to
             get.  If ``'both'`` (default), gets the upper and lower bounds of
             the central ``ci`` interval.  If ``'lower'``, gets the lower bound
             on the one-sided ``ci`` interval.  If ``'upper'``, gets the upper
-            bound on the one-sided ``ci`` interval.
+            bound on the one-sided ``ci`` interval.  If ``'hdi'``, gets the
+            upper and lower bounds of the highest density ``ci`` interval
+            (the narrowest interval containing ``ci`` of the samples, which
+            is tighter than the central interval for skewed distributions).
         n : int
             Number of samples from the aleatoric predictive distribution to
             take to compute the confidence intervals.
@@ -225,12 +275,15 @@ class ContinuousModel(Model):
             Inner proportion of predictive distribution to use a the
             confidence interval.
             Default = 0.95
-        side : str {'lower', 'upper', 'both'}
+        side : str {'lower', 'upper', 'both', 'hdi'}
             Whether to get the one- or two-sided interval, and which side to
             get.  If ``'both'`` (default), gets the upper and lower bounds of
             the central ``ci`` interval.  If ``'lower'``, gets the lower bound
             on the one-sided ``ci`` interval.  If ``'upper'``, gets the upper
-            bound on the one-sided ``ci`` interval.
+            bound on the one-sided ``ci`` interval.  If ``'hdi'``, gets the
+            upper and lower bounds of the highest density ``ci`` interval
+            (the narrowest interval containing ``ci`` of the samples, which
+            is tighter than the central interval for skewed distributions).
         n : int
             Number of samples from the epistemic predictive distribution to
             take to compute the confidence intervals.
@@ -287,6 +340,10 @@ class ContinuousModel(Model):
 
         """
 
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import plot_dist
+
         # Sample from the predictive distribution
         samples = self.predictive_sample(x, n=n, batch_size=batch_size)
 
@@ -302,7 +359,7 @@ class ContinuousModel(Model):
 
         # Plot the predictive distributions
         if individually:
-            rows = np.ceil(N / cols)
+            rows = -(-N // cols)
             for i in range(N):
                 plt.subplot(rows, cols, i + 1)
                 plot_dist(samples[:, i], **kwargs)
@@ -377,11 +434,9 @@ class ContinuousModel(Model):
         samples = samples.reshape([Ns, N])
         y = self._get_y(x, y).reshape([1, N])
 
-        # Percentiles of true y data along predictive distribution
-        prcs = np.argmax(np.sort(samples, axis=0) > y, axis=0) / Ns
-
-        # Argmax returns 0 when all samples are less than true value!
-        prcs[np.reshape(np.max(samples, axis=0) < y, [N])] = 1.0
+        # Percentiles of true y data along predictive distribution (the
+        # fraction of samples <= y, which doesn't require sorting the samples)
+        prcs = np.count_nonzero(samples <= y, axis=0) / Ns
 
         # Return percentiles
         return prcs.reshape([N, 1])
@@ -485,9 +540,11 @@ class ContinuousModel(Model):
 
         Parameters
         ----------
-        x_by : int or str or list of int or list of str
-            Which independent variable(s) to plot the log probability as a
-            function of.  That is, which columns in ``x`` to plot by.
+        x_by : int or str or list of int or list of str or |ndarray|
+            Which independent variable(s) to plot the coverage as a function
+            of.  That is, which columns in ``x`` to plot by (column names can
+            only be used if ``x`` is a |DataFrame|).  Or an array of the
+            values to plot by.
         x : |ndarray| or |DataFrame| or |Series| or Tensor or |DataGenerator|
             Independent variable values of the dataset to evaluate (aka the
             "features").  Or a |DataGenerator| for both x and y.
@@ -518,12 +575,17 @@ class ContinuousModel(Model):
             distribution in each bin.
         """
 
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import plot_by
+
         # Compute whether each sample was covered by the predictive interval
         covered = self.pred_dist_covered(
             x, y=y, n=n, ci=ci, batch_size=batch_size
         )
 
         # Plot coverage proportion as a fn of x_by cols of x
+        x_by = _x_by_values(x_by, x)
         xo, co = plot_by(x_by, 100 * covered, label="Actual", **kwargs)
 
         # Line kwargs
@@ -623,6 +685,11 @@ class ContinuousModel(Model):
         TODO
 
         """
+
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import plot_dist
+
         r2 = self.r_squared(x, y, n=n, batch_size=batch_size)
         plot_dist(r2, style=style, **kwargs)
         plt.xlabel("Bayesian R squared")
@@ -684,6 +751,11 @@ class ContinuousModel(Model):
         TODO
 
         """
+
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import plot_dist
+
         res = self.residuals(x, y, batch_size=batch_size)
         plot_dist(res, **kwargs)
         plt.xlabel("Residual (True - Predicted)")
@@ -829,6 +901,9 @@ class ContinuousModel(Model):
         * :meth:`~expected_calibration_error`
 
         """
+
+        import matplotlib.pyplot as plt
+
         p, p_hat = self.calibration_curve(
             x, y, n=n, resolution=resolution, batch_size=batch_size
         )
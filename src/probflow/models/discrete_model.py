@@ -1,8 +1,3 @@
-import matplotlib.pyplot as plt
-import numpy as np
-
-from probflow.utils.plotting import plot_discrete_dist
-
 from .continuous_model import ContinuousModel
 
 
@@ -91,6 +86,10 @@ class DiscreteModel(ContinuousModel):
             :func:`.plot_discrete_dist`
         """
 
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import plot_discrete_dist
+
         # Sample from the predictive distribution
         samples = self.predictive_sample(x, n=n)
 
@@ -105,7 +104,7 @@ class DiscreteModel(ContinuousModel):
             samples = samples.reshape([Ns, N])
 
         # Plot the predictive distributions
-        rows = np.ceil(N / cols)
+        rows = -(-N // cols)
         for i in range(N):
             plt.subplot(rows, cols, i + 1)
             plot_discrete_dist(samples[:, i])
@@ -1,18 +1,28 @@
+import itertools
+import numbers
 from typing import Callable, List, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
 import probflow.utils.ops as O
-from probflow.data import make_generator
+from probflow.data import ArrayDataGenerator, make_generator
 from probflow.modules import Module
 from probflow.utils.base import BaseCallback
-from probflow.utils.casting import to_numpy
-from probflow.utils.metrics import get_metric_fn
+from probflow.utils.casting import to_default_dtype, to_numpy, to_tensor
+from probflow.utils.metrics import _ELEMENTWISE_METRICS, get_metric_fn
 from probflow.utils.settings import Sampling, get_backend
 
 
+def _check_number(name, value, kind, minimum):
+    """Raise a TypeError if ``value`` is not a ``kind`` of number, or a
+    ValueError if it is less than ``minimum``"""
+    if isinstance(value, bool) or not isinstance(value, kind):
+        raise TypeError("{} must be a {}".format(name, kind.__name__.lower()))
+    if value < minimum:
+        raise ValueError("{} must be >={}".format(name, minimum))
+
+
 class Model(Module):
     """Abstract base class for probflow models.
 
@@ -52,6 +62,7 @@ class Model(Module):
     * :meth:`~posterior_sample`
     * :meth:`~posterior_ci`
     * :meth:`~prior_sample`
+    * :meth:`~iter_prior_sample`
     * :meth:`~posterior_plot`
     * :meth:`~prior_plot`
     * :meth:`~log_prob`
@@ -109,16 +120,26 @@ class Model(Module):
 
     def get_elbo(self):
         """Get the current ELBO on training data"""
+        if not isinstance(self._current_elbo, (type(None), float, np.number)):
+            self._current_elbo = to_numpy(self._current_elbo)[()]
         return self._current_elbo
 
-    def _train_step_tensorflow(self, n, flipout=False, eager=False, n_mc=1):
+    def _train_step_tensorflow(
+        self,
+        n,
+        flipout=False,
+        eager=False,
+        n_mc=1,
+        jit_compile=False,
+        sample_dtype=None,
+    ):
         """Get the training step function for TensorFlow"""
 
         import tensorflow as tf
 
         def train_fn(x_data, y_data):
             self.reset_kl_loss()
-            with Sampling(n=n_mc, flipout=flipout):
+            with Sampling(n=n_mc, flipout=flipout, dtype=sample_dtype):
                 with tf.GradientTape() as tape:
                     elbo_loss = self.elbo_loss(x_data, y_data, n, n_mc)
                 variables = self.trainable_variables
@@ -128,10 +149,14 @@ class Model(Module):
 
         if eager:
             return train_fn
+        elif jit_compile:
+            return tf.function(train_fn, jit_compile=True)
         else:
             return tf.function(train_fn)
 
-    def _train_step_pytorch(self, n, flipout=False, eager=False, n_mc=1):
+    def _train_step_pytorch(
+        self, n, flipout=False, eager=False, n_mc=1, sample_dtype=None
+    ):
         """Get the training step function for PyTorch"""
 
         import torch
@@ -140,7 +165,7 @@ class Model(Module):
 
             def train_fn(x_data, y_data):
                 self.reset_kl_loss()
-                with Sampling(n=n_mc, flipout=flipout):
+                with Sampling(n=n_mc, flipout=flipout, dtype=sample_dtype):
                     self._optimizer.zero_grad()
                     elbo_loss = self.elbo_loss(x_data, y_data, n, n_mc)
                     elbo_loss.backward()
@@ -163,7 +188,7 @@ class Model(Module):
 
                 def elbo_loss(self, *args):
                     self._probflow_model.reset_kl_loss()
-                    with Sampling(n=n_mc, flipout=flipout):
+                    with Sampling(n=n_mc, flipout=flipout, dtype=sample_dtype):
                         if len(args) == 1:
                             elbo_loss = self._probflow_model.elbo_loss(
                                 None, args[0], n, n_mc
@@ -214,12 +239,16 @@ class Model(Module):
             return train_fn
 
     def train_step(self, x_data, y_data):
-        """Perform one training step"""
+        """Perform one training step
+
+        The ELBO is summed on the backend and only copied to host memory when
+        requested via :meth:`get_elbo`, so that the training loop doesn't
+        have to wait on a device-to-host copy after every step.
+        """
         elbo = self._train_fn(x_data, y_data)
         if get_backend() == "pytorch":
-            self._current_elbo += elbo.detach().numpy()
-        else:
-            self._current_elbo += elbo.numpy()
+            elbo = elbo.detach()
+        self._current_elbo = self._current_elbo + elbo
 
     def fit(
         self,
@@ -236,6 +265,11 @@ class Model(Module):
         callbacks: List[BaseCallback] = [],
         eager: bool = False,
         n_mc: int = 1,
+        jit_compile: bool = False,
+        prefetch: bool = False,
+        data_on_device: bool = False,
+        drop_last: bool = False,
+        sample_dtype=None,
     ):
         r"""Fit the model to data
 
@@ -297,6 +331,52 @@ class Model(Module):
             batch.  Using a smaller number of MC samples is faster, but using a
             greater number of MC samples will decrease the variance of the
             gradients, leading to more stable parameter optimization.
+        jit_compile : bool
+            Whether to compile the training step with XLA (passed on to
+            ``tf.function``) so that the model's forward pass, loss, and
+            gradient computation can be fused into fewer kernels.  Ignored if
+            ``eager=True`` or when the backend is |PyTorch|.
+            Default = False
+        prefetch : bool
+            Whether to feed the data through a ``tf.data`` pipeline which
+            shuffles and batches the data within TensorFlow and prepares the
+            next batch while the current training step runs.  If a GPU is
+            available, batches are prefetched onto the GPU so that copying
+            the next batch overlaps with the current step.  Only used with
+            the |TensorFlow| backend when ``x`` and ``y`` are |ndarrays| and
+            ``num_workers`` is None.  This can speed up training on an
+            accelerator, but adds some per-batch overhead for small models
+            trained on a CPU.
+            Default = False
+        data_on_device : bool
+            Whether to copy the training data to the device (e.g. the GPU)
+            once before training, and take each batch from the copy on the
+            device, instead of copying every batch from host memory.  Only
+            use this if the whole dataset fits in the device's memory.  Only
+            used with the |TensorFlow| backend when ``x`` and ``y`` are
+            |ndarrays|, ``num_workers`` is None, and ``prefetch`` is False.
+            Default = False
+        drop_last : bool
+            Whether to drop the last batch of each epoch if it contains fewer
+            than ``batch_size`` samples.  Keeping every batch the same shape
+            means the training step only has to be traced (and, with
+            ``jit_compile=True``, XLA-compiled) once.  If ``shuffle=True``, a
+            different subset of samples is dropped each epoch.  Raises a
+            ValueError if ``batch_size`` is larger than the number of samples,
+            since no batches would be left.  Note that this is ignored if
+            ``x`` is a |DataGenerator|.
+            Default = False
+        sample_dtype : None or tf.dtype or torch.dtype
+            Datatype in which to draw samples from the parameters' variational
+            posteriors while training (e.g. ``tf.bfloat16``).  The sampling
+            noise is drawn and scaled at this reduced precision, but samples,
+            the KL divergences, and the loss are still computed in the default
+            datatype.  This reduces the memory bandwidth used by sampling on
+            accelerators.  Applies to parameters with a :class:`.Normal`
+            variational posterior, including the flipout weight perturbations
+            of :class:`.Dense` modules; parameters with other posteriors (e.g.
+            :class:`.ScaleParameter`) are sampled in the default datatype.
+            Default = None (i.e., use the default datatype)
 
 
         Example
@@ -305,6 +385,12 @@ class Model(Module):
         See the user guide section on :doc:`/user_guide/fitting`.
         """
 
+        # Check scalar arguments
+        _check_number("epochs", epochs, numbers.Integral, 0)
+        _check_number("n_mc", n_mc, numbers.Integral, 1)
+        if lr is not None:
+            _check_number("lr", lr, numbers.Real, 0)
+
         # Determine a somewhat reasonable learning rate if none was passed
         if lr is not None:
             self._learning_rate = lr
@@ -319,6 +405,7 @@ class Model(Module):
             batch_size=batch_size,
             shuffle=shuffle,
             num_workers=num_workers,
+            drop_last=drop_last,
         )
 
         # Use default optimizer if none specified
@@ -340,17 +427,57 @@ class Model(Module):
 
         # Use eager if input type is dataframe or series
         eager_types = (pd.DataFrame, pd.Series)
-        if any(isinstance(e, eager_types) for e in self._data.get_batch(0)):
+        is_pandas = any(
+            isinstance(e, eager_types) for e in self._data.get_batch(0)
+        )
+        if is_pandas:
             eager = True
 
+        # Feed in-memory arrays through a tf.data pipeline, using a single
+        # iterator for all epochs so batches are prefetched across epochs
+        batches = None
+        if (
+            prefetch
+            and get_backend() == "tensorflow"
+            and isinstance(self._data, ArrayDataGenerator)
+            and self._data.num_workers is None
+            and not is_pandas
+        ):
+            import tensorflow as tf
+
+            gpus = tf.config.list_logical_devices("GPU")
+            device = gpus[0].name if len(gpus) > 0 else None
+            dataset = self._data.tf_dataset(repeat=True, device=device)
+            batches = iter(dataset)
+
+        # Or store in-memory arrays on the device for the whole of training
+        elif (
+            data_on_device
+            and get_backend() == "tensorflow"
+            and isinstance(self._data, ArrayDataGenerator)
+            and self._data is not x  # don't modify the caller's generator
+            and self._data.num_workers is None
+            and not is_pandas
+        ):
+            self._data.to_device()
+
         # Create a function to perform one training step
         if get_backend() == "pytorch":
             self._train_fn = self._train_step_pytorch(
-                self._data.n_samples, flipout, eager=eager, n_mc=n_mc
+                self._data.n_samples,
+                flipout,
+                eager=eager,
+                n_mc=n_mc,
+                sample_dtype=sample_dtype,
             )
         else:
             self._train_fn = self._train_step_tensorflow(
-                self._data.n_samples, flipout, eager=eager, n_mc=n_mc
+                self._data.n_samples,
+                flipout,
+                eager=eager,
+                n_mc=n_mc,
+                jit_compile=jit_compile,
+                sample_dtype=sample_dtype,
             )
 
         # Assign model param to callbacks
@@ -376,7 +503,7 @@ class Model(Module):
                 c.on_epoch_start()
 
             # Update gradients for each batch
-            for x_data, y_data in self._data:
+            for x_data, y_data in self._training_batches(batches):
                 self.train_step(x_data, y_data)
 
             # Run callbacks at end of epoch
@@ -386,9 +513,21 @@ class Model(Module):
 
         # Run callbacks at end of training
         self._is_training = False
+        self.get_elbo()  # don't keep the last epoch's ELBO as a tensor
         for c in callbacks:
             c.on_train_end()
 
+    def _training_batches(self, batches=None):
+        """Iterate over one epoch of training batches, taken either from the
+        data generator or from an iterator over a repeated tf.data pipeline"""
+        if batches is None:
+            yield from self._data
+        elif self._data.x is None:
+            for y_data in itertools.islice(batches, len(self._data)):
+                yield None, y_data
+        else:
+            yield from itertools.islice(batches, len(self._data))
+
     def stop_training(self):
         """Stop the training of the model"""
         self._is_training = False
@@ -397,6 +536,8 @@ class Model(Module):
         """Set the learning rate used by this model's optimizer"""
         if not isinstance(lr, float):
             raise TypeError("lr must be a float")
+        elif lr < 0:
+            raise ValueError("lr must be >=0")
         else:
             self._learning_rate = lr
         if get_backend() == "pytorch":
@@ -407,20 +548,27 @@ class Model(Module):
         """Set the weight of the KL term's contribution to the ELBO loss"""
         if not isinstance(w, float):
             raise TypeError("w must be a float")
+        elif w < 0:
+            raise ValueError("w must be >=0")
         else:
             self._kl_weight = w
 
     def _sample(self, x, func, ed=None, axis=1, batch_size=None):
-        """Sample from the model"""
+        """Sample from the model
+
+        Each batch's samples are copied to host memory as soon as they are
+        drawn, so only one batch's worth of samples is held by the backend
+        at a time.
+        """
         samples = []
         for x_data, y_data in make_generator(
             x, test=True, batch_size=batch_size
         ):
             if x_data is None:
-                samples += [func(self())]
+                samples += [to_numpy(func(self()))]
             else:
-                samples += [func(self(O.expand_dims(x_data, ed)))]
-        return np.concatenate(to_numpy(samples), axis=axis)
+                samples += [to_numpy(func(self(O.expand_dims(x_data, ed))))]
+        return np.concatenate(samples, axis=axis)
 
     def predictive_sample(self, x=None, n=1000, batch_size=None):
         """Draw samples from the posterior predictive distribution given x
@@ -605,6 +753,14 @@ class Model(Module):
         TODO
         """
 
+        # Accumulate elementwise error metrics with backend ops, so only the
+        # final value has to be copied back from the device
+        metric_fn = get_metric_fn(metric)
+        if metric_fn in _ELEMENTWISE_METRICS:
+            return self._elementwise_metric(
+                *_ELEMENTWISE_METRICS[metric_fn], x, y, batch_size
+            )
+
         # Get true values and predictions
         y_true = []
         y_pred = []
@@ -617,16 +773,49 @@ class Model(Module):
         y_pred = np.concatenate(to_numpy(y_pred), axis=0)
 
         # Compute metric between true values and predictions
-        metric_fn = get_metric_fn(metric)
         return metric_fn(y_true, y_pred)
 
+    def _elementwise_metric(self, fn, mean, x, y=None, batch_size=None):
+        """Compute the sum (or mean) of an elementwise function of the errors
+        between the true values and the model's predictions"""
+        sums = []
+        count = 0
+        for x_data, y_data in make_generator(
+            x, y, test=True, batch_size=batch_size
+        ):
+            y_true = to_default_dtype(to_tensor(y_data))
+            y_pred = self(x_data).mean()
+            if len(O.shape(y_true)) == 1:
+                y_true = O.expand_dims(y_true, 1)
+            if len(O.shape(y_pred)) == 1:
+                y_pred = O.expand_dims(y_pred, 1)
+            errors = fn(y_true - y_pred)
+            sums += [O.sum(errors, axis=None)]
+            count += int(np.prod(O.shape(errors)))
+        total = to_numpy(O.add_n(sums))
+        return total / count if mean else total
+
+    def _check_param_names(self, names):
+        """Raise a ValueError if any of the names aren't parameters in the
+        model"""
+        missing = names - {p.name for p in self.parameters}
+        if len(missing) > 0:
+            raise ValueError(
+                "no parameter(s) named {} in this model".format(
+                    ", ".join(repr(e) for e in sorted(missing))
+                )
+            )
+
     def _param_data(self, params: Union[str, List[str], None], func: Callable):
         """Get data about parameters in the model"""
         if isinstance(params, str):
-            return [func(p) for p in self.parameters if p.name == params][0]
+            self._check_param_names({params})
+            return func(next(p for p in self.parameters if p.name == params))
         elif isinstance(params, list):
+            names = set(params)
+            self._check_param_names(names)
             return {
-                p.name: func(p) for p in self.parameters if p.name in params
+                p.name: func(p) for p in self.parameters if p.name in names
             }
         else:
             return {p.name: func(p) for p in self.parameters}
@@ -743,6 +932,41 @@ class Model(Module):
         """
         return self._param_data(params, lambda x: x.prior_sample(n=n))
 
+    def iter_prior_sample(self, params=None, n=10000):
+        """Draw samples from parameter priors, one parameter at a time
+
+        Unlike :meth:`prior_sample`, which returns the samples for all the
+        parameters at once, this only holds one parameter's samples in memory
+        at a time (unless the caller keeps them).
+
+
+        Parameters
+        ----------
+        params : str or list or None
+            Name(s) of the parameters to sample.  Default is to sample priors
+            of all parameters in the model.
+        n : int
+            Number of samples to take from each prior distribution.
+            Default = 10000
+
+
+        Yields
+        ------
+        name : str
+            Name of the parameter
+        samples : |ndarray|
+            Samples from that parameter's prior distribution, of size
+            (``n``,param.shape).
+        """
+        if isinstance(params, str):
+            params = [params]
+        if params is not None:
+            names = set(params)
+            self._check_param_names(names)
+        for p in self.parameters:
+            if params is None or p.name in names:
+                yield p.name, p.prior_sample(n=n)
+
     def _param_plot(
         self,
         func: Callable,
@@ -752,11 +976,16 @@ class Model(Module):
         **kwargs
     ):
         """Plot parameter data"""
+
+        import matplotlib.pyplot as plt
+
         if params is None:
             param_list = self.parameters
         else:
-            param_list = [p for p in self.parameters if p.name in params]
-        rows = int(np.ceil(len(param_list) / cols))
+            names = {params} if isinstance(params, str) else set(params)
+            self._check_param_names(names)
+            param_list = [p for p in self.parameters if p.name in names]
+        rows = -(-len(param_list) // cols)
         for iP in range(len(param_list)):
             plt.subplot(rows, cols, iP + 1)
             func(param_list[iP])
@@ -851,19 +1080,23 @@ class Model(Module):
 
         # Get a distribution of samples
         if distribution:
-            with Sampling(n=1, flipout=False):
-                probs = []
-                for i in range(n):
-                    t_probs = []
-                    for x_data, y_data in make_generator(
-                        x, y, batch_size=batch_size
-                    ):
-                        if x_data is None:
-                            t_probs += [self().log_prob(y_data)]
-                        else:
-                            t_probs += [self(x_data).log_prob(y_data)]
-                    probs += [np.concatenate(to_numpy(t_probs), axis=0)]
-            probs = np.stack(to_numpy(probs), axis=probs[0].ndim)
+            probs = []
+            for x_data, y_data in make_generator(x, y, batch_size=batch_size):
+
+                # Generative models have no datapoint axis to sample along
+                if x_data is None:
+                    with Sampling(n=1, flipout=False):
+                        t_probs = [self().log_prob(y_data) for _ in range(n)]
+                    probs += [np.stack(to_numpy(t_probs), axis=0)]
+
+                # Otherwise draw all n samples in a single forward pass
+                else:
+                    with Sampling(n=n, flipout=False):
+                        dist = self(O.expand_dims(x_data, 0))
+                        t_probs = dist.log_prob(O.expand_dims(y_data, 0))
+                    probs += [to_numpy(t_probs)]
+
+            probs = np.moveaxis(np.concatenate(probs, axis=1), 0, -1)
 
         # Use MAP estimates
         else:
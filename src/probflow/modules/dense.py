@@ -2,7 +2,11 @@ import probflow.utils.ops as O
 from probflow.modules.module import Module
 from probflow.parameters import DeterministicParameter, Parameter
 from probflow.utils.casting import to_tensor
-from probflow.utils.settings import get_flipout, get_samples
+from probflow.utils.settings import (
+    get_flipout,
+    get_sample_datatype,
+    get_samples,
+)
 
 
 class Dense(Module):
@@ -90,21 +94,27 @@ class Dense(Module):
             and get_samples() == 1
         ):
 
-            # Flipout-estimated weight samples
+            # Flipout-estimated weight and bias perturbations.  The bias is
+            # treated as the weight of a constant input, so both share one
+            # sign flip and are combined in a single elementwise pass
+            w_vars = self.weights.variables
+            b_vars = self.bias.variables
             s = O.rand_rademacher(O.shape(x))
             r = O.rand_rademacher([O.shape(x)[0], self.d_out])
-            norm_samples = O.randn([self.d_in, self.d_out])
-            w_samples = self.weights.variables["scale"] * norm_samples
-            w_noise = r * ((x * s) @ w_samples)
-            w_outputs = x @ self.weights.variables["loc"] + w_noise
-
-            # Flipout-estimated bias samples
-            r = O.rand_rademacher([O.shape(x)[0], self.d_out])
-            norm_samples = O.randn([self.d_out])
-            b_samples = self.bias.variables["scale"] * norm_samples
-            b_outputs = self.bias.variables["loc"] + r * b_samples
-
-            return w_outputs + b_outputs
+            # Weight noise is drawn at the sample datatype, if one is set
+            dtype = get_sample_datatype()
+            if dtype is None:
+                w_samples = w_vars["scale"] * O.randn([self.d_in, self.d_out])
+                b_samples = b_vars["scale"] * O.randn([self.d_out])
+            else:
+                w_scale = O.cast(w_vars["scale"], dtype)
+                b_scale = O.cast(b_vars["scale"], dtype)
+                w_noise = w_scale * O.randn([self.d_in, self.d_out], dtype)
+                b_noise = b_scale * O.randn([self.d_out], dtype)
+                w_samples = O.cast(w_noise)
+                b_samples = O.cast(b_noise)
+            noise = r * ((x * s) @ w_samples + b_samples)
+            return x @ w_vars["loc"] + b_vars["loc"] + noise
 
         # Without Flipout
         else:
@@ -13,30 +13,34 @@ class Module(BaseModule):
     """
 
     def _params(self, obj):
-        """Recursively search for |Parameters| contained within an object"""
-        if isinstance(obj, BaseParameter):
-            return [obj]
-        elif isinstance(obj, BaseModule):
-            return obj.parameters
-        elif isinstance(obj, list):
-            return self._list_params(obj)
-        elif isinstance(obj, dict):
-            return self._dict_params(obj)
-        else:
-            return []
+        """Search (iteratively, depth-first) for |Parameters| contained
+        within an object"""
+        params = []
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, BaseParameter):
+                params.append(obj)
+            elif isinstance(obj, BaseModule):
+                params.extend(obj.parameters)
+            elif isinstance(obj, list):
+                stack.extend(reversed(obj))
+            elif isinstance(obj, dict):
+                stack.extend(reversed(list(obj.values())))
+        return params
 
     def _list_params(self, the_list: List):
-        """Recursively search for |Parameters| contained in a list"""
-        return [p for e in the_list for p in self._params(e)]
+        """Search for |Parameters| contained in a list"""
+        return self._params(the_list)
 
     def _dict_params(self, the_dict: Dict):
-        """Recursively search for |Parameters| contained in a dict"""
-        return [p for _, e in the_dict.items() for p in self._params(e)]
+        """Search for |Parameters| contained in a dict"""
+        return self._params(the_dict)
 
     @property
     def parameters(self):
         """A list of |Parameters| in this |Module| and its sub-Modules."""
-        return [p for _, a in vars(self).items() for p in self._params(a)]
+        return self._params(list(vars(self).values()))
 
     @property
     def modules(self):
@@ -76,12 +80,12 @@ class Module(BaseModule):
         """Compute the sum of the Kullback-Leibler divergences between
         priors and their variational posteriors for all |Parameters| in this
         |Module| and its sub-Modules."""
-        return sum([p.kl_loss() for p in self.parameters])
+        return O.add_n([p.kl_loss() for p in self.parameters])
 
     def kl_loss_batch(self):
         """Compute the sum of additional Kullback-Leibler divergences due to
         data in this batch"""
-        return sum([e for m in self.modules for e in m._kl_losses])
+        return O.add_n([e for m in self.modules for e in m._kl_losses])
 
     def reset_kl_loss(self):
         """Reset additional loss due to KL divergences"""
@@ -1,6 +1,5 @@
 from typing import Callable, Dict, List, Type, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 import probflow.utils.ops as O
@@ -8,14 +7,19 @@ from probflow.distributions import Normal
 from probflow.utils.base import BaseDistribution, BaseParameter
 from probflow.utils.casting import to_numpy
 from probflow.utils.initializers import scale_xavier, xavier
-from probflow.utils.plotting import plot_dist
 from probflow.utils.settings import (
     Sampling,
+    get_sample_datatype,
     get_samples,
     get_static_sampling_uuid,
 )
 
 
+def _identity(x):
+    """Default (identity) transform"""
+    return x
+
+
 def cache_static_samples(fn):
     """Decorator to return static samples if they are currently cached"""
 
@@ -123,7 +127,7 @@ class Parameter(BaseParameter):
         self.shape = shape
         self.posterior_fn = posterior
         self.prior = prior
-        self.transform = transform if transform else lambda x: x
+        self.transform = transform if transform else _identity
         self.initializer = initializer
         self.name = name
         self._static_samples_uuid = None
@@ -144,6 +148,12 @@ class Parameter(BaseParameter):
             # Create the variables
             self.untransformed_variables[var] = O.new_variable(initial_value)
 
+        # Freeze variable names and their transforms (None for identity)
+        self._var_fns = tuple(
+            (n, var_transform.get(n)) for n in self.untransformed_variables
+        )
+        self._loc_fn = var_transform.get("loc")
+
     @property
     def n_parameters(self):
         """Get the number of independent parameters"""
@@ -169,10 +179,8 @@ class Parameter(BaseParameter):
     @property
     def variables(self):
         """Variables after applying their respective transformations"""
-        return {
-            name: self.var_transform[name](val)
-            for name, val in self.untransformed_variables.items()
-        }
+        uv = self.untransformed_variables
+        return {n: (f(uv[n]) if f else uv[n]) for n, f in self._var_fns}
 
     @property
     def posterior(self):
@@ -190,22 +198,67 @@ class Parameter(BaseParameter):
         """
         n_samples = get_samples()
         if n_samples is None:
-            return self.transform(self.posterior.mean())
+            sample = self._posterior_mean()
+        elif self.posterior_fn is Normal:
+            sample = self._normal_sample(n_samples)
         elif n_samples == 1:
-            return self.transform(self.posterior.sample())
+            sample = self.posterior.sample()
         else:
-            return self.transform(self.posterior.sample(n_samples))
+            sample = self.posterior.sample(n_samples)
+        if self.transform is _identity:
+            return sample
+        return self.transform(sample)
+
+    def _posterior_mean(self):
+        """Mean of the variational posterior.  For a Normal posterior this is
+        just the (transformed) loc variable, so the scale transform and the
+        backend distribution object are skipped entirely"""
+        if self.posterior_fn is not Normal:
+            return self.posterior.mean()
+        loc = self.untransformed_variables["loc"]
+        if self._loc_fn is None:
+            return 1.0 * loc  # a tensor, not the variable itself
+        return self._loc_fn(loc)
+
+    def _normal_sample(self, n_samples):
+        """Reparameterized sample from a Normal posterior, drawn directly
+        rather than by constructing a backend distribution object.  If a
+        sample datatype is set, the noise is drawn and scaled at that
+        precision, but is added to the loc at full precision."""
+        variables = self.variables
+        shape = O.shape(variables["loc"])
+        if n_samples > 1:
+            shape = [n_samples] + shape
+        dtype = get_sample_datatype()
+        if dtype is None:
+            return variables["loc"] + variables["scale"] * O.randn(shape)
+        noise = O.cast(variables["scale"], dtype) * O.randn(shape, dtype)
+        return variables["loc"] + O.cast(noise)
 
     def kl_loss(self):
         """Compute the sum of the Kullback–Leibler divergences between this
         parameter's priors and its variational posteriors."""
         if self.prior is None:
             return O.zeros([])
+        elif self.posterior_fn is Normal and type(self.prior) is Normal:
+            return self._normal_kl_loss()
         else:
             return O.sum(
                 O.kl_divergence(self.posterior, self.prior), axis=None
             )
 
+    def _normal_kl_loss(self):
+        """Closed-form KL divergence between a Normal posterior and a Normal
+        prior, computed from the variables directly rather than by
+        constructing backend distribution objects"""
+        variables = self.variables
+        ratio = variables["scale"] / self.prior["scale"]
+        diff = (variables["loc"] - self.prior["loc"]) / self.prior["scale"]
+        return O.sum(
+            0.5 * (O.square(ratio) + O.square(diff) - 1.0) - O.log(ratio),
+            axis=None,
+        )
+
     def bayesian_update(self):
         """Update priors to match the current posterior"""
         self.prior = self.posterior_fn(
@@ -340,6 +393,13 @@ class Parameter(BaseParameter):
             :meth:`.utils.plotting.plot_dist`
         """
 
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import _check_dist_args, plot_dist
+
+        # Check the arguments before drawing any samples
+        _check_dist_args(style, ci)
+
         # Sample from the posterior
         samples = self.posterior_sample(n=n)
 
@@ -399,6 +459,13 @@ class Parameter(BaseParameter):
             Default = use the default matplotlib color cycle
         """
 
+        import matplotlib.pyplot as plt
+
+        from probflow.utils.plotting import _check_dist_args, plot_dist
+
+        # Check the arguments before drawing any samples
+        _check_dist_args(style, ci)
+
         # Sample from the posterior
         samples = self.prior_sample(n=n)
 
@@ -0,0 +1,10 @@
+import importlib
+
+
+def __getattr__(name):
+    """Import the plotting utilities (and matplotlib) only when needed"""
+    if name == "plotting":
+        return importlib.import_module(".plotting", __name__)
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
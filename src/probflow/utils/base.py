@@ -15,7 +15,6 @@ __all__ = [
 
 
 from abc import ABC, abstractmethod
-from math import ceil
 
 from probflow.utils.casting import to_tensor
 from probflow.utils.settings import get_backend
@@ -164,7 +163,7 @@ class BaseDataGenerator(ABC):
 
     def __len__(self):
         """Number of batches per epoch"""
-        return int(ceil(self.n_samples / self.batch_size))
+        return -(-self.n_samples // self.batch_size)
 
     @abstractmethod
     def __getitem__(self, index):
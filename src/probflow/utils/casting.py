@@ -4,6 +4,7 @@ betweeen Tensors and numpy arrays.
 
 * :func:`.to_numpy`
 * :func:`.to_tensor`
+* :func:`.to_backend_tensor`
 * :func:`.to_default_dtype`
 * :func:`.make_input_tensor`
 
@@ -15,6 +16,7 @@ betweeen Tensors and numpy arrays.
 __all__ = [
     "to_numpy",
     "to_tensor",
+    "to_backend_tensor",
     "to_default_dtype",
     "make_input_tensor",
 ]
@@ -61,6 +63,21 @@ def to_tensor(x):
         return x  # TensorFlow auto-converts numpy arrays to tensors
 
 
+def to_backend_tensor(x):
+    """Make x a backend tensor, copying it to the device if needed
+
+    Unlike :func:`.to_tensor`, this also converts numpy arrays to tensors
+    with the TensorFlow backend, so that data which is used repeatedly only
+    has to be converted (and copied to the device) once.
+    """
+    if get_backend() == "pytorch":
+        return to_tensor(x)
+    else:
+        import tensorflow as tf
+
+        return tf.convert_to_tensor(to_tensor(x))
+
+
 def to_default_dtype(x):
     if get_backend() == "pytorch":
         return x.type(get_datatype())
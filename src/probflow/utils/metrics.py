@@ -31,6 +31,8 @@ __all__ = [
 import numpy as np
 import pandas as pd
 
+import probflow.utils.ops as O
+
 
 def as_numpy(fn):
     """Cast inputs to numpy arrays and same shape before computing metric"""
@@ -129,6 +131,16 @@ def f1_score(y_true, y_pred):
     return 2 * (p * r) / (p + r)
 
 
+# Metrics which are the mean or sum of an elementwise function of the errors,
+# and so can be accumulated batch-by-batch with backend ops.
+# Maps metric function -> (elementwise op, whether to take the mean)
+_ELEMENTWISE_METRICS = {
+    mean_squared_error: (O.square, True),
+    sum_squared_error: (O.square, False),
+    mean_absolute_error: (O.abs, True),
+}
+
+
 # TODO: jaccard_similarity
 
 
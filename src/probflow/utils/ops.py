@@ -12,6 +12,7 @@ The utils.ops module contains operations which run using the current backend.
 * :func:`.shape`
 * :func:`.eye`
 * :func:`.sum`
+* :func:`.add_n`
 * :func:`.prod`
 * :func:`.mean`
 * :func:`.std`
@@ -20,15 +21,18 @@ The utils.ops module contains operations which run using the current backend.
 * :func:`.square`
 * :func:`.sqrt`
 * :func:`.exp`
+* :func:`.log`
 * :func:`.relu`
 * :func:`.softplus`
 * :func:`.sigmoid`
 * :func:`.gather`
 * :func:`.cat`
+* :func:`.stack`
 * :func:`.additive_logistic_transform`
 * :func:`.insert_col_of`
 * :func:`.new_variable`
 * :func:`.log_cholesky_transform`
+* :func:`.cast`
 * :func:`.copy_tensor`
 
 ----------
@@ -48,6 +52,7 @@ __all__ = [
     "shape",
     "eye",
     "sum",
+    "add_n",
     "prod",
     "mean",
     "std",
@@ -61,10 +66,12 @@ __all__ = [
     "sigmoid",
     "gather",
     "cat",
+    "stack",
     "additive_logistic_transform",
     "insert_col_of",
     "new_variable",
     "log_cholesky_transform",
+    "cast",
     "copy_tensor",
 ]
 
@@ -168,19 +175,21 @@ def full(shape, value):
     else:
         import tensorflow as tf
 
-        return tf.cast(tf.fill(shape, value), dtype=get_datatype())
+        return tf.fill(shape, tf.constant(value, dtype=get_datatype()))
 
 
-def randn(shape):
+def randn(shape, dtype=None):
     """Tensor full of random values drawn from a standard normal."""
+    if dtype is None:
+        dtype = get_datatype()
     if get_backend() == "pytorch":
         import torch
 
-        return torch.randn(shape, dtype=get_datatype())
+        return torch.randn(shape, dtype=dtype)
     else:
         import tensorflow as tf
 
-        return tf.random.normal(shape, dtype=get_datatype())
+        return tf.random.normal(shape, dtype=dtype)
 
 
 def rand_rademacher(shape):
@@ -193,9 +202,11 @@ def rand_rademacher(shape):
         import tensorflow_probability as tfp
 
         try:  # for older versions of tfp, fall back on older version
-            return tfp.random.rademacher(shape)
+            return tfp.random.rademacher(shape, dtype=get_datatype())
         except AttributeError:  # pragma: no cover
-            return tfp.python.math.random_rademacher(shape)
+            return tfp.python.math.random_rademacher(
+                shape, dtype=get_datatype()
+            )
 
 
 def shape(x):
@@ -233,6 +244,20 @@ def sum(val, axis=-1, keepdims=False):
         return tf.reduce_sum(val, axis=axis, keepdims=keepdims)
 
 
+def add_n(vals):
+    """Element-wise sum of a list of tensors (zero if the list is empty)."""
+    if len(vals) == 0:
+        return zeros([])
+    elif get_backend() == "pytorch":
+        import torch
+
+        return torch.stack(vals).sum(dim=0)
+    else:
+        import tensorflow as tf
+
+        return tf.add_n(vals)
+
+
 def prod(val, axis=-1, keepdims=False):
     """The product."""
     if get_backend() == "pytorch":
@@ -327,6 +352,18 @@ def exp(val):
         return tf.exp(val)
 
 
+def log(val):
+    """The natural logarithm."""
+    if get_backend() == "pytorch":
+        import torch
+
+        return torch.log(val)
+    else:
+        import tensorflow as tf
+
+        return tf.math.log(val)
+
+
 def relu(val):
     """Linear rectification."""
     if get_backend() == "pytorch":
@@ -387,6 +424,18 @@ def cat(vals, axis=0):
         return tf.concat(vals, axis=axis)
 
 
+def stack(vals, axis=0):
+    """Stack tensors along a new dimension"""
+    if get_backend() == "pytorch":
+        import torch
+
+        return torch.stack(vals, dim=axis)
+    else:
+        import tensorflow as tf
+
+        return tf.stack(vals, axis=axis)
+
+
 def additive_logistic_transform(vals):
     """The additive logistic transformation"""
     if get_backend() == "pytorch":
@@ -501,6 +550,18 @@ def reshape(x, new_shape):
         return tf.reshape(x, new_shape)
 
 
+def cast(val, dtype=None):
+    """Cast a tensor to some datatype (the default datatype if None)"""
+    if dtype is None:
+        dtype = get_datatype()
+    if get_backend() == "pytorch":
+        return val.type(dtype)
+    else:
+        import tensorflow as tf
+
+        return tf.cast(val, dtype)
+
+
 def copy_tensor(x):
     """Copy a tensor, detaching it from the gradient/backend/etc/etc"""
     if get_backend() == "pytorch":
@@ -12,6 +12,7 @@ import numpy as np
 import pandas as pd
 
 COLORS = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+STYLES = ("fill", "line", "hist")
 
 
 def approx_kde(data, bins=500, bw=0.075):
@@ -44,16 +45,19 @@ def get_next_color(def_color, ix):
 
 def get_ix_label(ix, shape):
     """Get a string representation of the current index"""
-    dims = np.zeros(len(shape))
-    for d in range(len(shape) - 1, 0, -1):
-        prod = np.prod(shape[:d])
-        dims[d] = np.floor(ix / prod)
-        ix -= dims[d] * prod
-    dims[0] = ix
+    dims = [int(d) for d in np.unravel_index(ix, shape, order="F")]
     if len(shape) == 1:
-        return str(dims[0].astype("int32"))
+        return str(dims[0])
     else:
-        return str(list(dims.astype("int32")))
+        return str(dims)
+
+
+def _check_dist_args(style, ci):
+    """Check the arguments for plotting a distribution of samples"""
+    if style not in STYLES:
+        raise ValueError("style must be 'fill', 'line', or 'hist'")
+    if ci < 0.0 or ci > 1.0:
+        raise ValueError("ci must be between 0 and 1")
 
 
 def plot_dist(
@@ -102,8 +106,7 @@ def plot_dist(
     """
 
     # Check inputs
-    if ci < 0.0 or ci > 1.0:
-        raise ValueError("ci must be between 0 and 1")
+    _check_dist_args(style, ci)
 
     # If 1d make 2d
     if data.ndim == 1:
@@ -118,11 +121,9 @@ def plot_dist(
 
     # Compute confidence intervals
     if ci:
-        cis = np.empty((Nd, 2))
         ci0 = 100 * (0.5 - ci / 2.0)
         ci1 = 100 * (0.5 + ci / 2.0)
-        for i in range(Nd):
-            cis[i, :] = np.percentile(data[:, i], [ci0, ci1])
+        cis = np.percentile(data, [ci0, ci1], axis=0).T
 
     # Plot the data
     for i in range(Nd):
@@ -159,8 +160,6 @@ def plot_dist(
             if ci:
                 k = (data[:, i] > cis[i, 0]) & (data[:, i] < cis[i, 1])
                 plt.hist(data[k, i], alpha=alpha, bins=be, color=next_color)
-        else:
-            raise ValueError("style must be 'fill', 'line', or 'hist'")
 
     # Only show the legend if there are >1 sample set
     if Nd > 1 and legend:
@@ -324,6 +323,23 @@ def plot_categorical_dist(x):
         plt.xticks(xc.index[::step], [str(e) for e in xc.index[::step]])
 
 
+def _binned_stat(bin_id, data, func, bins):
+    """Apply func to the data in each of bins 1 to bins-1 (NaN if empty)"""
+    if func is np.mean or func is len:
+        counts = np.bincount(bin_id, minlength=bins)[1:bins].astype(float)
+        if func is len:
+            stat = counts
+        else:
+            sums = np.bincount(bin_id, weights=data, minlength=bins)
+            with np.errstate(invalid="ignore"):
+                stat = sums[1:bins] / counts
+        stat[counts == 0] = np.nan
+        return stat
+    else:
+        grouped = pd.Series(data).groupby(bin_id).agg(func)
+        return grouped.reindex(range(1, bins)).values.astype(float)
+
+
 def plot_by(
     x, data, bins=30, func="mean", plot=True, bootstrap=100, ci=0.95, **kwargs
 ):
@@ -412,43 +428,35 @@ def plot_by(
         # Create bins over x
         edges = np.linspace(min(x), max(x), int(bins)).flatten()
         edges[-1] += 1e-9
-        bin_id = np.digitize(x, edges)
+        bin_id = np.digitize(x, edges).flatten()
         x_o = (edges[:-1] + edges[1:]) / 2.0  # bin centers
+        data = data.flatten()
 
         # Bootstrap estimate coverage uncertainty
         if bootstrap is not None:
 
             # Compute func for data in each bins
-            boots = pd.DataFrame(index=range(1, bins))
+            boots = np.empty((bins - 1, bootstrap))
             for iB in range(bootstrap):
-                ix = np.random.choice(range(data.size), size=data.size)
-                boots[str(iB)] = (
-                    pd.Series(data[ix].flatten())
-                    .groupby(bin_id[ix].flatten())
-                    .agg(func)
-                )
+                ix = np.random.randint(data.size, size=data.size)
+                boots[:, iB] = _binned_stat(bin_id[ix], data[ix], func, bins)
 
             # Plot coverage confidence intervals
             ci = np.array(ci)
             ci_lb = 100 * (0.5 - ci / 2.0)
             ci_ub = 100 * (0.5 + ci / 2.0)
-            boots = boots.values
             prc_lb = np.nanpercentile(boots, ci_lb, axis=1)
             prc_ub = np.nanpercentile(boots, ci_ub, axis=1)
             plt.fill_between(x_o, prc_lb, prc_ub, alpha=0.3, facecolor=color)
 
         # Compute func for data in each bins
-        data_o = pd.DataFrame(index=range(1, bins))
-        data_o["data"] = (
-            pd.Series(data.flatten()).groupby(bin_id.flatten()).agg(func)
-        )
-        data_o = data_o["data"]
+        data_o = _binned_stat(bin_id, data, func, bins)
 
         # Plot coverage
         plt.plot(x_o, data_o, **kwargs)
 
         # Return values
-        return x_o, data_o.values
+        return x_o, data_o
 
     # 2 Dimensional
     elif x.shape[1] == 2:
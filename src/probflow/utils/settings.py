@@ -24,6 +24,19 @@ you might have to set the default datatype to match the datatype of your data.
 * :func:`.set_datatype`
 
 
+Sample datatype
+---------------
+
+Which datatype to use when drawing random samples from parameters' variational
+posteriors.  If ``None``, samples are drawn using the default datatype.  Using
+a reduced-precision type (e.g. ``bfloat16``) halves the memory traffic of
+sampling on accelerators; samples are cast back to the default datatype before
+they are used.
+
+* :func:`.get_sample_datatype`
+* :func:`.set_sample_datatype`
+
+
 Samples
 -------
 
@@ -75,6 +88,8 @@ __all__ = [
     "set_backend",
     "get_datatype",
     "set_datatype",
+    "get_sample_datatype",
+    "set_sample_datatype",
     "get_samples",
     "set_samples",
     "get_flipout",
@@ -99,6 +114,9 @@ class _Settings:
         Whether to use flipout where possible
     _DATATYPE : tf.dtype or torch.dtype
         Default datatype to use for tensors
+    _SAMPLE_DATATYPE : None or tf.dtype or torch.dtype
+        Datatype to use when drawing posterior samples.  If |None|, will use
+        the default datatype.
     _STATIC_SAMPLING_UUID : None or uuid.UUID
         UUID of the current static sampling regime
     """
@@ -108,6 +126,7 @@ class _Settings:
         self._SAMPLES = None
         self._FLIPOUT = False
         self._DATATYPE = None
+        self._SAMPLE_DATATYPE = None
         self._STATIC_SAMPLING_UUID = None
 
 
@@ -188,6 +207,41 @@ def set_datatype(datatype):
             raise TypeError("datatype must be a tf.dtypes.DType")
 
 
+def get_sample_datatype():
+    """Get the datatype used for drawing posterior samples
+
+    Returns
+    -------
+    dtype : None or tf.dtype or torch.dtype
+        The datatype to draw samples in, or None to use the default datatype
+    """
+    return __SETTINGS__._SAMPLE_DATATYPE
+
+
+def set_sample_datatype(datatype):
+    """Set the datatype to use for drawing posterior samples
+
+    Parameters
+    ----------
+    datatype : None or tf.dtype or torch.dtype
+        The datatype to draw samples in, or None to use the default datatype
+    """
+    if get_backend() == "pytorch":
+        import torch
+
+        if datatype is None or isinstance(datatype, torch.dtype):
+            __SETTINGS__._SAMPLE_DATATYPE = datatype
+        else:
+            raise TypeError("datatype must be a torch.dtype")
+    else:
+        import tensorflow as tf
+
+        if datatype is None or isinstance(datatype, tf.dtypes.DType):
+            __SETTINGS__._SAMPLE_DATATYPE = datatype
+        else:
+            raise TypeError("datatype must be a tf.dtypes.DType")
+
+
 def get_samples():
     """Get how many samples (if any) are being drawn from parameter posteriors
 
@@ -267,6 +321,14 @@ class Sampling:
     flipout : bool
         Whether to use flipout where possible while sampling during training.
         Default = False
+    dtype : None or tf.dtype or torch.dtype
+        Datatype to draw posterior samples in (e.g. ``tf.bfloat16``).
+        Samples are cast back to the default datatype before being returned.
+        Parameters with a :class:`.Normal` variational posterior (and the
+        flipout weight perturbations of :class:`.Dense` modules) draw their
+        samples at this precision; parameters with other posteriors ignore it
+        and sample in the default datatype.
+        Default = None (i.e., sample using the default datatype)
 
 
     Example
@@ -332,10 +394,11 @@ class Sampling:
 
     """
 
-    def __init__(self, n=None, flipout=None, static=None):
+    def __init__(self, n=None, flipout=None, static=None, dtype=None):
         self._n = n
         self._flipout = flipout
         self._static = static
+        self._dtype = dtype
 
     def __enter__(self):
         """Begin sampling."""
@@ -345,6 +408,8 @@ class Sampling:
             set_flipout(self._flipout)
         if self._static is not None:
             set_static_sampling_uuid(uuid.uuid4())
+        if self._dtype is not None:
+            set_sample_datatype(self._dtype)
 
     def __exit__(self, _type, _val, _tb):
         """End sampling and reset sampling settings to defaults"""
@@ -354,3 +419,5 @@ class Sampling:
             set_flipout(False)
         if self._static is not None:
             set_static_sampling_uuid(None)
+        if self._dtype is not None:
+            set_sample_datatype(None)
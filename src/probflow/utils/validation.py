@@ -14,22 +14,41 @@ import numpy as np
 from probflow.utils.base import BaseParameter
 from probflow.utils.settings import get_backend
 
+# Types which are tensor-like regardless of the backend
+_TENSOR_LIKE_TYPES = (int, float, np.ndarray, list)
 
-def ensure_tensor_like(obj, name):
-    """Determine whether an object can be cast to a Tensor"""
 
-    # Check for non-backend-dependent types
-    if isinstance(obj, (int, float, np.ndarray, list)):
-        return
+# Map from backend name to the backend-dependent tensor-like types
+_BACKEND_TENSOR_TYPES = {}
+
+# Map from backend name to the exact types which have already passed
+# validation, so most checks are a single set lookup on type(obj)
+_VALID_TYPES = {}
+
 
-    # Check for backend-dependent types
-    if get_backend() == "pytorch":
-        import torch
+def _backend_tensor_types(backend):
+    """Get (and cache) the tensor-like types for a backend"""
+    if backend not in _BACKEND_TENSOR_TYPES:
+        if backend == "pytorch":
+            import torch
 
-        tensor_types = (torch.Tensor, BaseParameter)
-    else:
-        import tensorflow as tf
+            types = (torch.Tensor, BaseParameter)
+        else:
+            import tensorflow as tf
 
-        tensor_types = (tf.Tensor, tf.Variable, BaseParameter)
-    if not isinstance(obj, tensor_types):
+            types = (tf.Tensor, tf.Variable, BaseParameter)
+        _BACKEND_TENSOR_TYPES[backend] = types
+    return _BACKEND_TENSOR_TYPES[backend]
+
+
+def ensure_tensor_like(obj, name):
+    """Determine whether an object can be cast to a Tensor"""
+    backend = get_backend()
+    valid_types = _VALID_TYPES.setdefault(backend, set())
+    if type(obj) in valid_types:
+        return
+    if not isinstance(obj, _TENSOR_LIKE_TYPES) and not isinstance(
+        obj, _backend_tensor_types(backend)
+    ):
         raise TypeError(name + " must be Tensor-like")
+    valid_types.add(type(obj))
@@ -42,6 +42,10 @@ def test_Model_0D():
     y = -x + 1
     my_model.fit(x, y, batch_size=5, epochs=3)
 
+    # ELBO should be summed on the backend but returned as a numpy scalar
+    assert isinstance(my_model.get_elbo(), np.floating)
+    assert np.isfinite(my_model.get_elbo())
+
     # Shouldn't be training
     assert my_model._is_training is False
 
@@ -292,6 +292,27 @@ def test_sum():
     assert is_close(val.numpy(), 6.4)
 
 
+def test_add_n():
+    """Tests add_n"""
+
+    pf.set_backend("pytorch")
+
+    # Should sum elementwise across tensors in the list
+    vals = [torch.ones([5, 3]), 2 * torch.ones([5, 3]), 3 * torch.ones([5, 3])]
+    val = ops.add_n(vals)
+    assert isinstance(val, torch.Tensor)
+    assert val.ndim == 2
+    assert val.shape[0] == 5
+    assert val.shape[1] == 3
+    assert np.all(val.numpy() == 6.0)
+
+    # Should return a scalar zero for an empty list
+    val = ops.add_n([])
+    assert isinstance(val, torch.Tensor)
+    assert val.ndim == 0
+    assert val.numpy() == 0.0
+
+
 def test_prod():
     """Tests prod"""
 
@@ -431,6 +452,14 @@ def test_exp():
     )
 
 
+def test_log():
+    """Tests log"""
+    pf.set_backend("pytorch")
+    _test_elementwise(
+        ops.log, [np.exp(-1.0), 1.0, np.e, np.exp(4.0)], [-1.0, 0.0, 1.0, 4.0]
+    )
+
+
 def test_relu():
     """Tests relu"""
     pf.set_backend("pytorch")
@@ -547,3 +576,31 @@ def test_insert_col_of():
     assert val.shape[1] == 3
     assert val.shape[2] == 6
     assert (val[:, :, 0] == 1).all()
+
+
+def test_cast():
+    """Tests cast"""
+
+    pf.set_backend("pytorch")
+
+    x = ops.cast(torch.tensor([1.0, 2.0]), torch.bfloat16)
+    assert isinstance(x, torch.Tensor)
+    assert x.dtype == torch.bfloat16
+
+    # Should cast back to the default datatype
+    x = ops.cast(x)
+    assert x.dtype == torch.float32
+    assert np.allclose(x.numpy(), [1.0, 2.0])
+
+
+def test_stack():
+    """Tests stack"""
+
+    pf.set_backend("pytorch")
+
+    vals = [torch.ones([5, 3]), 2 * torch.ones([5, 3])]
+    val = ops.stack(vals)
+    assert isinstance(val, torch.Tensor)
+    assert val.shape == (2, 5, 3)
+    assert np.all(val.numpy()[1] == 2.0)
+    assert ops.stack(vals, axis=1).shape == (5, 2, 3)
@@ -1,4 +1,5 @@
 import numpy as np
+import tensorflow as tf
 
 from probflow.applications import DenseRegression
 
@@ -36,6 +37,23 @@ def test_DenseRegression():
     assert ub.shape[1] == 1
 
 
+def test_DenseRegression_sample_dtype():
+    """Tests fitting probflow.applications.DenseRegression w/ sample_dtype"""
+
+    # Data
+    x = np.random.randn(100, 5).astype("float32")
+    w = np.random.randn(5, 1).astype("float32")
+    y = x @ w + 1
+
+    # Fit the model w/ flipout noise drawn in bfloat16
+    model = DenseRegression([5, 20, 1])
+    model.fit(x, y, batch_size=10, epochs=2, sample_dtype=tf.bfloat16)
+    preds = model.predict(x[:11, :])
+    assert preds.dtype == np.float32
+    assert preds.shape == (11, 1)
+    assert np.all(np.isfinite(preds))
+
+
 def test_DenseRegression_heteroscedastic():
     """Tests probflow.applications.DenseRegression w/ heteroscedastic"""
 
@@ -61,6 +61,20 @@ def test_EarlyStopping_given_MonitorMetric():
     my_model.fit(x, y, batch_size=5, epochs=3, callbacks=[mm, es])
 
 
+def test_EarlyStopping_given_MonitorMetric_interval():
+
+    # Get a model and data
+    my_model, x, y = get_model_and_data()
+
+    # Epochs where the metric wasn't evaluated shouldn't count
+    mm = MonitorMetric("mae", x[:5], y[:5], interval=3)
+    es = EarlyStopping(mm, patience=0)
+    my_model.fit(x, y, batch_size=5, epochs=4, callbacks=[mm, es])
+    assert mm.current_epoch == 4
+    assert es.count == 0
+    assert es.best == mm.metrics[0]
+
+
 def test_EarlyStopping_given_MonitorELBO():
 
     # Get a model and data
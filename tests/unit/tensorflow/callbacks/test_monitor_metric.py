@@ -1,5 +1,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
+import tensorflow as tf
 from get_model_and_data import get_model_and_data
 
 from probflow.callbacks import MonitorMetric
@@ -23,10 +25,29 @@ def test_MonitorMetric(plot):
     assert len(mm.epochs) == 10
     assert isinstance(mm.metrics, list)
     assert len(mm.metrics) == 10
+
+    # Validation data should have been converted to tensors only once
+    x_batch, y_batch = mm.data.get_batch(0)
+    assert isinstance(x_batch, tf.Tensor)
+    assert isinstance(y_batch, tf.Tensor)
+    assert np.all(x_batch.numpy() == x_val)
+
     mm.plot()
     if plot:
         plt.show()
 
+    # Only compute the metric every few epochs, and at the end of training
+    with pytest.raises(TypeError):
+        MonitorMetric("mae", x_val, y_val, interval=1.5)
+    with pytest.raises(ValueError):
+        MonitorMetric("mae", x_val, y_val, interval=0)
+    mm3 = MonitorMetric("mae", x_val, y_val, interval=3)
+    my_model.fit(x, y, batch_size=5, epochs=10, callbacks=[mm3])
+    assert mm3.current_epoch == 10
+    assert mm3.epochs == [3, 6, 9, 10]
+    assert len(mm3.metrics) == 4
+    assert len(mm3.wall_times) == 4
+
     # Test plotting vs time, and passing kwargs to plt.plot
     mm.plot(x="time", label="model1")
     if plot:
@@ -30,6 +30,10 @@ def test_MonitorParameter(plot):
     # Test MonitorParameter with a list of parameters
     mp = MonitorParameter(["Weight", "Bias"])
     my_model.fit(x, y, batch_size=5, epochs=10, callbacks=[mp])
+    assert len(mp.parameter_values) == 10
+    assert all(isinstance(v, dict) for v in mp.parameter_values)
+    assert isinstance(mp.current_params["Weight"], np.ndarray)
+    assert isinstance(mp.current_params["Bias"], np.ndarray)
     plt.figure()
     plt.subplot(2, 1, 1)
     mp.plot("Weight")
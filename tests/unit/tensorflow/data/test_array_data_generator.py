@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import pytest
+import tensorflow as tf
 
 from probflow.data import ArrayDataGenerator
 
@@ -136,3 +137,120 @@ def test_ArrayDataGenerator():
     x2, y2 = dg[0]
     assert np.all(x1.values == x2.values)
     assert np.all(y1.values == y2.values)
+
+
+def test_ArrayDataGenerator_tf_dataset():
+    """Tests probflow.data.ArrayDataGenerator.tf_dataset"""
+
+    # Create some data
+    x = np.random.randn(100, 3)
+    y = np.random.randn(100, 1)
+
+    # Batches should match those generated by the generator
+    dg = ArrayDataGenerator(x, y, batch_size=30)
+    batches = list(dg.tf_dataset())
+    assert len(batches) == len(dg) == 4
+    for i, (xb, yb) in enumerate(batches):
+        assert np.all(xb.numpy() == dg[i][0])
+        assert np.all(yb.numpy() == dg[i][1])
+
+    # Shuffling should permute but cover all the data each epoch
+    dg = ArrayDataGenerator(x, y, batch_size=30, shuffle=True)
+    ds = dg.tf_dataset()
+    epoch1 = np.concatenate([xb.numpy() for xb, _ in ds])
+    epoch2 = np.concatenate([xb.numpy() for xb, _ in ds])
+    assert np.any(epoch1 != epoch2)
+    assert np.all(np.sort(epoch1, axis=0) == np.sort(x, axis=0))
+
+    # Repeated dataset should generate whole, separately-shuffled epochs
+    it = iter(dg.tf_dataset(repeat=True))
+    for _ in range(3):
+        epoch = np.concatenate([next(it)[0].numpy() for _ in range(len(dg))])
+        assert np.all(np.sort(epoch, axis=0) == np.sort(x, axis=0))
+
+    # Should be able to prefetch onto a device
+    dg = ArrayDataGenerator(x, y, batch_size=30)
+    batches = list(dg.tf_dataset(device="/CPU:0"))
+    assert len(batches) == 4
+    assert np.all(batches[0][0].numpy() == x[:30])
+
+    # Generative models should only generate y
+    dg = ArrayDataGenerator(x, batch_size=30)
+    yb = next(iter(dg.tf_dataset()))
+    assert yb.shape == (30, 3)
+
+    # Should raise an error with pandas data
+    dg = ArrayDataGenerator(pd.DataFrame(x), pd.Series(y[:, 0]))
+    with pytest.raises(TypeError):
+        dg.tf_dataset()
+
+
+def test_ArrayDataGenerator_to_device():
+    """Tests probflow.data.ArrayDataGenerator.to_device"""
+
+    # Create some data
+    x = np.random.randn(100, 3)
+    y = np.random.randn(100, 1)
+
+    # Batches should be tensors which match the original data
+    dg = ArrayDataGenerator(x, y, batch_size=30)
+    dg.to_device("/CPU:0")
+    assert len(dg) == 4
+    for i, (xb, yb) in enumerate(dg):
+        assert isinstance(xb, tf.Tensor)
+        assert isinstance(yb, tf.Tensor)
+        assert np.all(xb.numpy() == x[i * 30 : (i + 1) * 30])
+        assert np.all(yb.numpy() == y[i * 30 : (i + 1) * 30])
+
+    # Shuffled batches should be gathered on the device
+    dg = ArrayDataGenerator(x, y, batch_size=30, shuffle=True)
+    dg.to_device()
+    xb, yb = dg[0]
+    assert isinstance(xb, tf.Tensor)
+    assert np.all(xb.numpy() == x[dg.ids[:30]])
+    assert np.all(yb.numpy() == y[dg.ids[:30]])
+
+    # Generative models should only store y
+    dg = ArrayDataGenerator(x, batch_size=30)
+    dg.to_device()
+    xb, yb = dg[0]
+    assert xb is None
+    assert isinstance(yb, tf.Tensor)
+
+    # Should raise an error with pandas data
+    dg = ArrayDataGenerator(pd.DataFrame(x), pd.Series(y[:, 0]))
+    with pytest.raises(TypeError):
+        dg.to_device()
+
+
+def test_ArrayDataGenerator_drop_last():
+    """Tests probflow.data.ArrayDataGenerator w/ drop_last=True"""
+
+    x = np.random.randn(100, 3)
+    y = np.random.randn(100, 1)
+
+    # Should error with invalid drop_last
+    with pytest.raises(TypeError):
+        ArrayDataGenerator(x, y, drop_last=1)
+
+    # Should error if dropping the last batch would leave no batches
+    with pytest.raises(ValueError):
+        ArrayDataGenerator(x, y, batch_size=101, drop_last=True)
+    with pytest.raises(ValueError):
+        ArrayDataGenerator(x[:0], y[:0], drop_last=True)
+    assert len(ArrayDataGenerator(x, y, batch_size=100, drop_last=True)) == 1
+    assert len(ArrayDataGenerator(x, y, batch_size=101)) == 1
+
+    # Last partial batch should be dropped
+    dg = ArrayDataGenerator(x, y, batch_size=30)
+    assert len(dg) == 4
+    dg = ArrayDataGenerator(x, y, batch_size=30, drop_last=True)
+    assert len(dg) == 3
+    batches = list(dg)
+    assert len(batches) == 3
+    assert all(xb.shape[0] == 30 for xb, _ in batches)
+
+    # And from the tf.data pipeline
+    batches = list(dg.tf_dataset())
+    assert len(batches) == 3
+    assert all(xb.shape[0] == 30 for xb, _ in batches)
@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import pytest
 import tensorflow_probability as tfp
 
@@ -161,6 +162,17 @@ def test_ContinuousModel(plot):
     xo, co = model.coverage_by(x[:, :1], x, y)
     assert isinstance(xo, np.ndarray)
     assert isinstance(co, np.ndarray)
+
+    # coverage by a column index, or a DataFrame column name
+    xo2, _ = model.coverage_by(0, x, y)
+    assert np.allclose(xo, xo2)
+    df = pd.DataFrame(
+        x, columns=["a"] + ["c" + str(i) for i in range(1, x.shape[1])]
+    )
+    xo2, _ = model.coverage_by("a", df, y)
+    assert np.allclose(xo, xo2)
+    with pytest.raises(TypeError):
+        model.coverage_by("a", x, y)
     if plot:
         plt.title("should be coverage by plot")
         plt.show()
@@ -365,3 +377,62 @@ def test_ContinuousModel_multivariate():
     # predictive_prc should not work with nonscalar output
     with pytest.raises(NotImplementedError):
         model.predictive_prc(x[:10, :], y[:10, :], n=10)
+
+
+def test_ContinuousModel_predictive_prc():
+    """Tests ContinuousModel.predictive_prc at the extremes"""
+
+    class MyModel(ContinuousModel):
+        def __init__(self):
+            self.weight = Parameter([5, 1], name="Weight")
+            self.bias = Parameter([1, 1], name="Bias")
+            self.std = ScaleParameter([1, 1], name="Std")
+
+        def __call__(self, x):
+            return Normal(x @ self.weight() + self.bias(), self.std())
+
+    model = MyModel()
+    x = np.random.randn(10, 5).astype("float32")
+    y = np.full([10, 1], 1e6, dtype="float32")
+    prcs = model.predictive_prc(x, y, n=100)
+    assert prcs.shape == (10, 1)
+    assert np.all(prcs == 1.0)
+    prcs = model.predictive_prc(x, -y, n=100, batch_size=3)
+    assert prcs.shape == (10, 1)
+    assert np.all(prcs == 0.0)
+
+
+def test_ContinuousModel_hdi():
+    """Tests highest density intervals and batched one-sided intervals"""
+
+    from probflow.models.continuous_model import _hdi
+
+    # HDI of a skewed distribution is narrower than the central interval
+    samples = np.random.exponential(size=(10000, 3))
+    lb, ub = _hdi(samples, 0.9)
+    assert lb.shape == (3,)
+    assert ub.shape == (3,)
+    assert np.all(lb < 0.05)
+    assert np.all(np.mean((samples >= lb) & (samples <= ub), axis=0) >= 0.9)
+    clb, cub = np.percentile(samples, [5, 95], axis=0)
+    assert np.all(ub - lb < cub - clb)
+
+    class MyModel(ContinuousModel):
+        def __init__(self):
+            self.weight = Parameter([5, 1], name="Weight")
+            self.bias = Parameter([1, 1], name="Bias")
+            self.std = ScaleParameter([1, 1], name="Std")
+
+        def __call__(self, x):
+            return Normal(x @ self.weight() + self.bias(), self.std())
+
+    model = MyModel()
+    x = np.random.randn(21, 5).astype("float32")
+    lb, ub = model.predictive_interval(x, side="hdi")
+    assert lb.shape == (21, 1)
+    assert np.all(lb <= ub)
+    lb, ub = model.predictive_interval(x, side="hdi", batch_size=7)
+    assert lb.shape == (21, 1)
+    assert np.all(lb <= ub)
+    llb = model.predictive_interval(x, side="lower", batch_size=7)
+    assert llb.shape == (21, 1)
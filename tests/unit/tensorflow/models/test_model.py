@@ -1,3 +1,4 @@
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 import tensorflow as tf
@@ -12,6 +13,7 @@ from probflow.parameters import (
     Parameter,
     ScaleParameter,
 )
+from probflow.utils.settings import Sampling
 
 tfd = tfp.distributions
 
@@ -54,6 +56,8 @@ def test_Model_0D():
     # but error w/ wrong type
     with pytest.raises(TypeError):
         my_model.set_learning_rate("asdf")
+    with pytest.raises(ValueError):
+        my_model.set_learning_rate(-1.0)
 
     # Should be able to set learning rate
     assert my_model._kl_weight == 1.0
@@ -63,6 +67,20 @@ def test_Model_0D():
     # but error w/ wrong type
     with pytest.raises(TypeError):
         my_model.set_kl_weight("asdf")
+    with pytest.raises(ValueError):
+        my_model.set_kl_weight(-1.0)
+
+    # fit should check its scalar arguments
+    with pytest.raises(TypeError):
+        my_model.fit(x, y, epochs=1.5)
+    with pytest.raises(ValueError):
+        my_model.fit(x, y, epochs=-1)
+    with pytest.raises(ValueError):
+        my_model.fit(x, y, n_mc=0)
+    with pytest.raises(TypeError):
+        my_model.fit(x, y, lr="asdf")
+    with pytest.raises(ValueError):
+        my_model.fit(x, y, lr=-0.1)
 
     # predictive samples
     samples = my_model.predictive_sample(x[:30], n=50)
@@ -106,6 +124,19 @@ def test_Model_0D():
     assert isinstance(metric, np.floating)
     assert metric >= 0
 
+    # error metrics should match those computed from the predictions
+    y_pred = my_model.predict(x[:30])
+    err = y[:30] - y_pred
+    for name, val in [
+        ("mse", np.mean(err**2)),
+        ("sse", np.sum(err**2)),
+        ("mae", np.mean(np.abs(err))),
+    ]:
+        assert is_close(my_model.metric(name, x[:30], y[:30]), val)
+        assert is_close(
+            my_model.metric(name, x[:30], y[:30], batch_size=7), val
+        )
+
     # posterior_mean w/ no args should return all params
     val = my_model.posterior_mean()
     assert isinstance(val, dict)
@@ -131,6 +162,14 @@ def test_Model_0D():
     assert all(isinstance(val[v], np.ndarray) for v in val)
     assert all(val[v].ndim == 1 for v in val)
 
+    # Should error w/ names of parameters which aren't in the model
+    with pytest.raises(ValueError):
+        my_model.posterior_mean("asdf")
+    with pytest.raises(ValueError):
+        my_model.posterior_sample(["Weight", "asdf"])
+    with pytest.raises(ValueError):
+        my_model.posterior_plot("asdf")
+
     # posterior_sample w/ no args should return all params
     val = my_model.posterior_sample(n=20)
     assert isinstance(val, dict)
@@ -226,6 +265,18 @@ def test_Model_0D():
     assert all(val[v].ndim == 1 for v in val)
     assert all(val[v].shape[0] == 20 for v in val)
 
+    # iter_prior_sample should generate samples one param at a time
+    gen = my_model.iter_prior_sample(["Weight", "Std"], n=20)
+    name, samples = next(gen)
+    assert name == "Weight"
+    assert isinstance(samples, np.ndarray)
+    assert samples.shape[0] == 20
+    assert [name for name, _ in gen] == ["Std"]
+    assert len(list(my_model.iter_prior_sample(n=20))) == 3
+    assert [n for n, _ in my_model.iter_prior_sample("Bias", n=20)] == ["Bias"]
+    with pytest.raises(ValueError):
+        list(my_model.iter_prior_sample("asdf"))
+
     # log_prob should return log prob of each sample by default
     probs = my_model.log_prob(x[:30], y[:30])
     assert isinstance(probs, np.ndarray)
@@ -252,6 +303,15 @@ def test_Model_0D():
     assert probs.ndim == 1
     assert probs.shape[0] == 10
 
+    # log_prob should return samples w/ distribution = True and batching
+    probs = my_model.log_prob(
+        x[:30], y[:30], n=10, distribution=True, batch_size=7
+    )
+    assert isinstance(probs, np.ndarray)
+    assert probs.ndim == 2
+    assert probs.shape[0] == 30
+    assert probs.shape[1] == 10
+
     # prob should return prob of each sample by default
     probs = my_model.prob(x[:30], y[:30])
     assert isinstance(probs, np.ndarray)
@@ -305,6 +365,30 @@ def test_Model_force_eager():
     my_model.fit(x, y, batch_size=50, epochs=2, eager=True)
 
 
+def test_Model_trains_appended_parameters():
+    """Tests parameters appended to a list attribute in place are trained"""
+
+    class MyModel(Model):
+        def __init__(self):
+            self.weights = [Parameter(name="Weight0")]
+            self.std = ScaleParameter(name="Std")
+
+        def __call__(self, x):
+            return Normal(x * sum(w() for w in self.weights), self.std())
+
+    my_model = MyModel()
+    x = np.random.randn(100).astype("float32")
+    y = -x + 1
+    assert len(my_model.trainable_variables) == 4
+
+    # Append a parameter after variables have already been collected
+    my_model.weights.append(Parameter(name="Weight1"))
+    assert len(my_model.trainable_variables) == 6
+    before = my_model.weights[1].posterior_mean()
+    my_model.fit(x, y, batch_size=50, epochs=2)
+    assert np.all(my_model.weights[1].posterior_mean() != before)
+
+
 def test_Model_force_no_flipout():
     """Tests fitting probflow.model.Model forcing flipout=False"""
 
@@ -326,6 +410,103 @@ def test_Model_force_no_flipout():
     my_model.fit(x, y, batch_size=50, epochs=2, flipout=False)
 
 
+def test_Model_jit_compile():
+    """Tests fitting probflow.model.Model with jit_compile=True"""
+
+    class MyModel(Model):
+        def __init__(self):
+            self.weight = Parameter(name="Weight")
+            self.bias = Parameter(name="Bias")
+            self.std = ScaleParameter(name="Std")
+
+        def __call__(self, x):
+            return Normal(x * self.weight() + self.bias(), self.std())
+
+    # Instantiate the model
+    my_model = MyModel()
+
+    # Fit the model
+    x = np.random.randn(100).astype("float32")
+    y = -x + 1
+    my_model.fit(x, y, batch_size=50, epochs=2, jit_compile=True)
+    assert isinstance(my_model.get_elbo(), np.floating)
+
+    # Should only have to trace once w/ drop_last
+    my_model.fit(x, y, batch_size=30, epochs=2, drop_last=True)
+    assert my_model._train_fn.experimental_get_tracing_count() == 1
+
+    # Should error instead of silently not training if no batches are left
+    with pytest.raises(ValueError):
+        my_model.fit(x, y, batch_size=1000, epochs=1, drop_last=True)
+
+
+def test_Model_sample_dtype():
+    """Tests fitting probflow.model.Model with reduced-precision sampling"""
+
+    class MyModel(Model):
+        def __init__(self):
+            self.weight = Parameter(name="Weight")
+            self.bias = Parameter(name="Bias")
+            self.std = ScaleParameter(name="Std")
+
+        def __call__(self, x):
+            return Normal(x * self.weight() + self.bias(), self.std())
+
+    # Instantiate the model
+    my_model = MyModel()
+
+    # Fit the model
+    x = np.random.randn(100).astype("float32")
+    y = -x + 1
+    my_model.fit(x, y, batch_size=50, epochs=2, sample_dtype=tf.bfloat16)
+    assert isinstance(my_model.get_elbo(), np.floating)
+    assert np.isfinite(my_model.get_elbo())
+
+    # Samples should still be in the default datatype
+    with Sampling(n=10, dtype=tf.bfloat16):
+        samples = my_model.weight()
+    assert samples.dtype == tf.float32
+    assert samples.shape == (10, 1)
+
+    # Non-Normal posteriors ignore the sample datatype
+    with Sampling(n=10, dtype=tf.bfloat16):
+        samples = my_model.std()
+    assert samples.dtype == tf.float32
+    assert samples.shape == (10, 1)
+    assert np.all(samples.numpy() > 0)
+
+
+def test_Model_prefetch():
+    """Tests fitting probflow.model.Model using a tf.data pipeline"""
+
+    class MyModel(Model):
+        def __init__(self):
+            self.weight = Parameter(name="Weight")
+            self.bias = Parameter(name="Bias")
+            self.std = ScaleParameter(name="Std")
+
+        def __call__(self, x):
+            return Normal(x * self.weight() + self.bias(), self.std())
+
+    # Instantiate the model
+    my_model = MyModel()
+
+    # Fit the model
+    x = np.random.randn(100).astype("float32")
+    y = -x + 1
+    my_model.fit(x, y, batch_size=30, epochs=2, prefetch=True)
+    my_model.fit(x, y, batch_size=30, epochs=2, prefetch=True, shuffle=True)
+    assert isinstance(my_model.get_elbo(), np.floating)
+
+    # Or with the data stored on the device
+    my_model.fit(x, y, batch_size=30, epochs=2, data_on_device=True)
+    assert isinstance(my_model._data.get_batch(0)[0], tf.Tensor)
+    my_model.fit(
+        x, y, batch_size=30, epochs=2, data_on_device=True, shuffle=True
+    )
+    assert isinstance(my_model.get_elbo(), np.floating)
+
+
 def test_Model_nonprobabilistic():
     """Tests fitting probflow.model.Model with a non-probabilistic dense layer.
     Shouldn't use flipout in this case (default is to use it), will error if it
@@ -681,6 +862,9 @@ def test_generative_Model():
     # Fit the model
     model.fit(X, batch_size=10, epochs=3)
 
+    # Fit the model w/ a tf.data pipeline
+    model.fit(X, batch_size=10, epochs=3, prefetch=True)
+
     # predictive samples
     samples = model.predictive_sample(n=50)
     assert isinstance(samples, np.ndarray)
@@ -762,6 +946,29 @@ def test_Model_nesting():
     assert my_model.kl_loss().numpy() > my_model.module.kl_loss().numpy()
 
 
+def test_Model_param_data_by_name():
+    """Tests selecting parameters by name for posterior means and plots"""
+
+    class MyModel(Model):
+        def __init__(self):
+            self.w = Parameter(name="w")
+            self.w2 = Parameter(name="w2")
+            self.std = ScaleParameter(name="std")
+
+        def __call__(self, x):
+            return Normal(x * self.w() + self.w2(), self.std())
+
+    my_model = MyModel()
+    val = my_model.posterior_mean(["w2", "std"])
+    assert set(val) == {"w2", "std"}
+
+    # A name should only match that parameter, not others containing it
+    plt.figure()
+    my_model.posterior_plot("w2")
+    assert len(plt.gcf().axes) == 1
+    plt.close()
+
+
 def test_Model_multiple_mc_0d_eager():
     """Fit probflow.model.Model w/ n_mc>1 to 0d data in eager mode"""
 
@@ -321,3 +321,96 @@ def test_Module_lists_and_dicts_nesting():
             + the_module.a_dict["c"].p2.kl_loss().numpy()
         ),
     )
+
+
+def test_Module_parameters_up_to_date():
+    """Tests that parameter and module lists track changes to the Module"""
+
+    class TestSubModule(Module):
+        def __init__(self):
+            self.p1 = Parameter(name="TestSubParam1")
+
+        def __call__(self, x):
+            return x * self.p1()
+
+    class TestModule(Module):
+        def __init__(self):
+            self.p1 = Parameter(name="TestParam1")
+            self.s1 = TestSubModule()
+
+        def __call__(self, x):
+            return self.s1(x) + self.p1()
+
+    the_module = TestModule()
+    assert len(the_module.parameters) == 2
+    assert len(the_module.modules) == 2
+
+    # Modifying a returned list shouldn't modify the module
+    the_module.parameters.append(1)
+    assert len(the_module.parameters) == 2
+
+    # Adding a parameter to a sub-module should update the parent
+    the_module.s1.p2 = Parameter(name="TestSubParam2")
+    assert len(the_module.parameters) == 3
+    assert "TestSubParam2" in [p.name for p in the_module.parameters]
+
+    # Replacing a sub-module with a parameter
+    the_module.s1 = Parameter(name="TestParam2")
+    assert len(the_module.parameters) == 2
+    assert len(the_module.modules) == 1
+
+    # Deleting a parameter
+    del the_module.s1
+    assert len(the_module.parameters) == 1
+    assert len(the_module.trainable_variables) == 2
+
+    # Non-structural attributes shouldn't affect the parameter list
+    the_module.a_float = 1.0
+    assert len(the_module.parameters) == 1
+
+    # Appending to a list attribute in place
+    the_module.a_list = []
+    assert len(the_module.parameters) == 1
+    the_module.a_list.append(Parameter(name="ListParam"))
+    assert len(the_module.parameters) == 2
+    assert len(the_module.trainable_variables) == 4
+    assert "ListParam" in [p.name for p in the_module.parameters]
+    assert len(the_module.modules) == 1
+
+    # Adding to a dict attribute in place
+    the_module.a_dict = {}
+    assert len(the_module.parameters) == 2
+    the_module.a_dict["k"] = Parameter(name="DictParam")
+    assert len(the_module.parameters) == 3
+    assert len(the_module.trainable_variables) == 6
+    assert "DictParam" in [p.name for p in the_module.parameters]
+    assert len(the_module.modules) == 1
+
+    # Adding a sub-module to a sub-module's list in place
+    the_module.s2 = TestSubModule()
+    assert len(the_module.modules) == 2
+    the_module.s2.a_list = []
+    the_module.s2.a_list.append(Parameter(name="SubListParam"))
+    assert len(the_module.parameters) == 5
+    assert "SubListParam" in [p.name for p in the_module.parameters]
+    assert len(the_module.modules) == 2
+
+
+def test_Module_deeply_nested_containers():
+    """Tests finding parameters in deeply nested lists and dicts"""
+
+    class TestModule(Module):
+        def __init__(self):
+            self.p1 = Parameter(name="First")
+            nested = [Parameter(name="Deepest")]
+            for _ in range(5000):
+                nested = [{"a": nested}]
+            self.nested = nested
+            self.p2 = Parameter(name="Last")
+
+        def __call__(self, x):
+            return x
+
+    the_module = TestModule()
+    names = [p.name for p in the_module.parameters]
+    assert names == ["First", "Deepest", "Last"]
@@ -14,6 +14,18 @@ def is_close(a, b, tol=1e-3):
     return np.abs(a - b) < tol
 
 
+def assert_static_groups(samples, groups):
+    """Samples in the same group should be identical, and samples in
+    different groups should differ everywhere"""
+    samples = np.stack([s.numpy() for s in samples])
+    same = samples[:, None] == samples[None, :]
+    same = same.reshape(same.shape[:2] + (-1,))
+    groups = np.array(groups)
+    in_group = groups[:, None] == groups[None, :]
+    assert np.all(same[in_group])
+    assert not np.any(same[~in_group])
+
+
 def test_Parameter_scalar():
     """Tests the generic scalar Parameter"""
 
@@ -48,8 +60,9 @@ def test_Parameter_scalar():
     assert isinstance(param.variables["scale"], tf.Tensor)
 
     # posterior should be a distribution object
-    assert isinstance(param.posterior, BaseDistribution)
-    assert isinstance(param.posterior(), tfd.Normal)
+    posterior = param.posterior
+    assert isinstance(posterior, BaseDistribution)
+    assert isinstance(posterior(), tfd.Normal)
 
     # __call__ should return the MAP estimate by default
     sample1 = param()
@@ -92,23 +105,9 @@ def test_Parameter_scalar():
         with Sampling(n=1):
             sample4 = param()
             sample5 = param()
-    assert sample1.ndim == 1
-    assert sample2.ndim == 1
-    assert sample3.ndim == 1
-    assert sample4.ndim == 1
-    assert sample5.ndim == 1
-    assert sample1.shape[0] == 1
-    assert sample2.shape[0] == 1
-    assert sample3.shape[0] == 1
-    assert sample4.shape[0] == 1
-    assert sample5.shape[0] == 1
-    assert sample1.numpy() != sample2.numpy()
-    assert sample1.numpy() != sample3.numpy()
-    assert sample2.numpy() == sample3.numpy()
-    assert sample1.numpy() != sample4.numpy()
-    assert sample1.numpy() != sample5.numpy()
-    assert sample4.numpy() == sample5.numpy()
-    assert sample2.numpy() != sample4.numpy()
+    samples = [sample1, sample2, sample3, sample4, sample5]
+    assert all(s.shape == (1,) for s in samples)
+    assert_static_groups(samples, [0, 1, 1, 2, 2])
 
     # sampling statement should allow static samples (and work w/ n>1)
     with Sampling(static=True):
@@ -119,24 +118,9 @@ def test_Parameter_scalar():
         with Sampling(n=5):
             sample3 = param()
             sample4 = param()
-    assert sample1.ndim == 2
-    assert sample2.ndim == 2
-    assert sample3.ndim == 2
-    assert sample4.ndim == 2
-    assert sample1.shape[0] == 5
-    assert sample1.shape[1] == 1
-    assert sample2.shape[0] == 5
-    assert sample2.shape[1] == 1
-    assert sample3.shape[0] == 5
-    assert sample3.shape[1] == 1
-    assert sample4.shape[0] == 5
-    assert sample4.shape[1] == 1
-    assert np.all(sample1.numpy() == sample2.numpy())
-    assert np.all(sample1.numpy() != sample3.numpy())
-    assert np.all(sample1.numpy() != sample4.numpy())
-    assert np.all(sample2.numpy() != sample3.numpy())
-    assert np.all(sample2.numpy() != sample4.numpy())
-    assert np.all(sample3.numpy() == sample4.numpy())
+    samples = [sample1, sample2, sample3, sample4]
+    assert all(s.shape == (5, 1) for s in samples)
+    assert_static_groups(samples, [0, 0, 1, 1])
 
     # kl_loss should return sum of kl divergences
     kl_loss = param.kl_loss()
@@ -151,13 +135,15 @@ def test_Parameter_scalar():
     assert prior_sample.shape[0] == 7
 
     # prior and posterior shouldn't be the same (post was randomly initialized)
-    assert tf.reduce_all(param.prior.loc != param.posterior.loc).numpy()
-    assert tf.reduce_all(param.prior.scale != param.posterior.scale).numpy()
+    posterior = param.posterior
+    assert tf.reduce_all(param.prior.loc != posterior.loc).numpy()
+    assert tf.reduce_all(param.prior.scale != posterior.scale).numpy()
 
     # but they should be the same after running bayesian_update
     param.bayesian_update()
-    assert tf.reduce_all(param.prior.loc == param.posterior.loc).numpy()
-    assert tf.reduce_all(param.prior.scale == param.posterior.scale).numpy()
+    posterior = param.posterior
+    assert tf.reduce_all(param.prior.loc == posterior.loc).numpy()
+    assert tf.reduce_all(param.prior.scale == posterior.scale).numpy()
 
 
 def test_Parameter_no_prior():
@@ -183,68 +169,34 @@ def test_Parameter_no_prior():
     assert np.all(np.isnan(prior_sample))
 
 
-def test_Parameter_1D():
-    """Tests a 1D Parameter"""
+def test_Parameter_normal_kl_loss():
+    """Tests the closed-form Normal/Normal kl_loss matches tfp's"""
 
-    # Create 1D parameter
-    param = Parameter(shape=5)
+    from probflow.distributions import Normal
 
-    # kl_loss should still be scalar
+    param = Parameter(shape=[4, 3], prior=Normal(1.0, 2.0))
     kl_loss = param.kl_loss()
+    kl_tfp = tf.reduce_sum(tfd.kl_divergence(param.posterior(), param.prior()))
     assert isinstance(kl_loss, tf.Tensor)
     assert kl_loss.ndim == 0
+    assert is_close(kl_loss.numpy(), kl_tfp.numpy())
 
-    # posterior_mean should return mean
-    sample1 = param.posterior_mean()
-    sample2 = param.posterior_mean()
-    assert sample1.ndim == 1
-    assert sample2.ndim == 1
-    assert sample1.shape[0] == 5
-    assert sample2.shape[0] == 5
-    assert np.all(sample1 == sample2)
-
-    # posterior_sample should return samples
-    sample1 = param.posterior_sample()
-    sample2 = param.posterior_sample()
-    assert sample1.ndim == 1
-    assert sample2.ndim == 1
-    assert sample1.shape[0] == 5
-    assert sample2.shape[0] == 5
-    assert np.all(sample1 != sample2)
-
-    # posterior_sample should be able to return multiple samples
-    sample1 = param.posterior_sample(10)
-    sample2 = param.posterior_sample(10)
-    assert sample1.ndim == 2
-    assert sample2.ndim == 2
-    assert sample1.shape[0] == 10
-    assert sample1.shape[1] == 5
-    assert sample2.shape[0] == 10
-    assert sample2.shape[1] == 5
-    assert np.all(sample1 != sample2)
-
-    # prior_sample should still be 1D
-    prior_sample = param.prior_sample()
-    assert prior_sample.ndim == 0
-    prior_sample = param.prior_sample(n=7)
-    assert prior_sample.ndim == 1
-    assert prior_sample.shape[0] == 7
-
-    # n_parameters property
-    nparams = param.n_parameters
-    assert isinstance(nparams, int)
-    assert nparams == 5
+    # and should be zero when the prior matches the posterior
+    param.bayesian_update()
+    assert is_close(param.kl_loss().numpy(), 0.0)
 
 
-def test_Parameter_2D():
-    """Tests a 2D Parameter"""
+@pytest.mark.parametrize("shape", [5, [5, 4]])
+def test_Parameter_ND(shape):
+    """Tests 1D and 2D Parameters"""
 
-    # Create 1D parameter
-    param = Parameter(shape=[5, 4], name="lala")
+    # Create parameter
+    param = Parameter(shape=shape, name="lala")
+    dims = (shape,) if isinstance(shape, int) else tuple(shape)
 
     # repr
     pstr = param.__repr__()
-    assert pstr == "<pf.Parameter lala shape=[5, 4]>"
+    assert pstr == "<pf.Parameter lala shape={}>".format(list(dims))
 
     # kl_loss should still be scalar
     kl_loss = param.kl_loss()
@@ -254,36 +206,22 @@ def test_Parameter_2D():
     # posterior_mean should return mean
     sample1 = param.posterior_mean()
     sample2 = param.posterior_mean()
-    assert sample1.ndim == 2
-    assert sample2.ndim == 2
-    assert sample1.shape[0] == 5
-    assert sample1.shape[1] == 4
-    assert sample2.shape[0] == 5
-    assert sample2.shape[1] == 4
+    assert sample1.shape == dims
+    assert sample2.shape == dims
     assert np.all(sample1 == sample2)
 
     # posterior_sample should return samples
     sample1 = param.posterior_sample()
     sample2 = param.posterior_sample()
-    assert sample1.ndim == 2
-    assert sample2.ndim == 2
-    assert sample1.shape[0] == 5
-    assert sample1.shape[1] == 4
-    assert sample2.shape[0] == 5
-    assert sample2.shape[1] == 4
+    assert sample1.shape == dims
+    assert sample2.shape == dims
     assert np.all(sample1 != sample2)
 
     # posterior_sample should be able to return multiple samples
     sample1 = param.posterior_sample(10)
     sample2 = param.posterior_sample(10)
-    assert sample1.ndim == 3
-    assert sample2.ndim == 3
-    assert sample1.shape[0] == 10
-    assert sample1.shape[1] == 5
-    assert sample1.shape[2] == 4
-    assert sample2.shape[0] == 10
-    assert sample2.shape[1] == 5
-    assert sample2.shape[2] == 4
+    assert sample1.shape == (10,) + dims
+    assert sample2.shape == (10,) + dims
     assert np.all(sample1 != sample2)
 
     # prior_sample should still be 1D
@@ -296,7 +234,7 @@ def test_Parameter_2D():
     # n_parameters property
     nparams = param.n_parameters
     assert isinstance(nparams, int)
-    assert nparams == 20
+    assert nparams == int(np.prod(dims))
 
 
 def test_Parameter_slicing():
@@ -342,18 +280,24 @@ def test_Parameter_slicing():
     assert sl.shape[3] == 5
 
 
-def test_Parameter_posterior_ci():
+@pytest.mark.parametrize("shape", [1, 5, [5, 4]])
+def test_Parameter_posterior_ci(shape):
     """Tests probflow.parameters.Parameter.posterior_ci"""
 
-    # With a scalar parameter
-    param = Parameter()
-    lb, ub = param.posterior_ci()
+    param = Parameter(shape=shape)
+    dims = (shape,) if isinstance(shape, int) else tuple(shape)
+    lb, ub = param.posterior_ci(n=100)
     assert isinstance(lb, np.ndarray)
     assert isinstance(ub, np.ndarray)
-    assert lb.ndim == 1
-    assert ub.ndim == 1
-    assert lb.shape[0] == 1
-    assert ub.shape[0] == 1
+    assert lb.shape == dims
+    assert ub.shape == dims
+    assert np.all(lb <= ub)
+
+    # With the default number of samples
+    if shape == 1:
+        lb, ub = param.posterior_ci()
+        assert lb.shape == dims
+        assert ub.shape == dims
 
     # Should error w/ invalid ci or n vals
     with pytest.raises(ValueError):
@@ -363,28 +307,6 @@ def test_Parameter_posterior_ci():
     with pytest.raises(ValueError):
         lb, ub = param.posterior_ci(n=0)
 
-    # With a 1D parameter
-    param = Parameter(shape=5)
-    lb, ub = param.posterior_ci()
-    assert isinstance(lb, np.ndarray)
-    assert isinstance(ub, np.ndarray)
-    assert lb.ndim == 1
-    assert ub.ndim == 1
-    assert lb.shape[0] == 5
-    assert ub.shape[0] == 5
-
-    # With a 2D parameter
-    param = Parameter(shape=[5, 4])
-    lb, ub = param.posterior_ci()
-    assert isinstance(lb, np.ndarray)
-    assert isinstance(ub, np.ndarray)
-    assert lb.ndim == 2
-    assert ub.ndim == 2
-    assert lb.shape[0] == 5
-    assert lb.shape[1] == 4
-    assert ub.shape[0] == 5
-    assert ub.shape[1] == 4
-
 
 def test_Parameter_float_initializer():
     """Tests a 2D Parameter with a float initializer"""
@@ -397,3 +319,22 @@ def test_Parameter_float_initializer():
     # all should have been initialized to 1
     vals = param()
     assert np.all(vals == 1.0)
+
+
+def test_Parameter_normal_posterior_samples():
+    """Tests samples drawn from a Normal posterior match its moments"""
+
+    param = Parameter(shape=3, initializer={"loc": 2.0, "scale": 1.0})
+    scale = param.variables["scale"].numpy()
+    samples = param.posterior_sample(20000)
+    assert samples.shape == (20000, 3)
+    assert np.all(np.abs(samples.mean(axis=0) - 2.0) < 0.1)
+    assert np.all(np.abs(samples.std(axis=0) - scale) < 0.1)
+
+
+def test_Parameter_normal_posterior_mean():
+    """Tests the MAP estimate of a Normal posterior matches its mean"""
+
+    param = Parameter(shape=[3, 2], transform=tf.exp)
+    assert np.allclose(param().numpy(), tf.exp(param.posterior.mean()).numpy())
+    assert param().shape == (3, 2)
@@ -157,6 +157,13 @@ def test_full():
     assert twos.shape[2] == 3
     assert np.all(twos.numpy() == 2.0)
 
+    # Should be built directly in the default datatype
+    pf.set_datatype(tf.float64)
+    vals = ops.full([3], 0.1)
+    assert vals.dtype == tf.float64
+    assert np.all(vals.numpy() == 0.1)
+    pf.set_datatype(tf.float32)
+
 
 def test_randn():
     """Tests randn"""
@@ -193,6 +200,11 @@ def test_randn():
     assert x.shape[2] == 3
     assert np.unique(x.numpy()).shape[0] == 5 * 4 * 3
 
+    # Other dtype
+    x = ops.randn([5, 4], dtype=tf.float16)
+    assert x.dtype == tf.float16
+    assert x.shape == (5, 4)
+
 
 def test_rand_rademacher():
     """Tests rand_rademacher"""
@@ -228,6 +240,14 @@ def test_rand_rademacher():
     assert x.shape[2] == 3
     assert np.all((x.numpy() == -1) | (x.numpy() == 1))
 
+    # Should be drawn directly in the default datatype
+    assert x.dtype == tf.float32
+    pf.set_datatype(tf.float64)
+    x = ops.rand_rademacher([5, 4])
+    assert x.dtype == tf.float64
+    assert np.all((x.numpy() == -1) | (x.numpy() == 1))
+    pf.set_datatype(tf.float32)
+
 
 def test_shape():
     """Tests shape"""
@@ -302,6 +322,25 @@ def test_sum():
     assert is_close(val.numpy(), 6.4)
 
 
+def test_add_n():
+    """Tests add_n"""
+
+    # Should sum elementwise across tensors in the list
+    vals = [tf.ones([5, 3]), 2 * tf.ones([5, 3]), 3 * tf.ones([5, 3])]
+    val = ops.add_n(vals)
+    assert isinstance(val, tf.Tensor)
+    assert val.ndim == 2
+    assert val.shape[0] == 5
+    assert val.shape[1] == 3
+    assert np.all(val.numpy() == 6.0)
+
+    # Should return a scalar zero for an empty list
+    val = ops.add_n([])
+    assert isinstance(val, tf.Tensor)
+    assert val.ndim == 0
+    assert val.numpy() == 0.0
+
+
 def test_prod():
     """Tests prod"""
 
@@ -430,6 +469,13 @@ def test_exp():
     )
 
 
+def test_log():
+    """Tests log"""
+    _test_elementwise(
+        ops.log, [np.exp(-1.0), 1.0, np.e, np.exp(4.0)], [-1.0, 0.0, 1.0, 4.0]
+    )
+
+
 def test_relu():
     """Tests relu"""
     _test_elementwise(
@@ -496,3 +542,27 @@ def test_gather():
     assert output.numpy()[0, 3] == 1.0
     assert output.numpy()[1, 3] == 3.0
     assert output.numpy()[2, 3] == 5.0
+
+
+def test_cast():
+    """Tests cast"""
+
+    x = ops.cast(tf.constant([1.0, 2.0]), tf.bfloat16)
+    assert isinstance(x, tf.Tensor)
+    assert x.dtype == tf.bfloat16
+
+    # Should cast back to the default datatype
+    x = ops.cast(x)
+    assert x.dtype == tf.float32
+    assert np.allclose(x.numpy(), [1.0, 2.0])
+
+
+def test_stack():
+    """Tests stack"""
+
+    vals = [tf.ones([5, 3]), 2 * tf.ones([5, 3])]
+    val = ops.stack(vals)
+    assert isinstance(val, tf.Tensor)
+    assert val.shape == (2, 5, 3)
+    assert np.all(val.numpy()[1] == 2.0)
+    assert ops.stack(vals, axis=1).shape == (5, 2, 3)
@@ -69,6 +69,10 @@ def test_plot_dist(plot):
     with pytest.raises(ValueError):
         pf.utils.plotting.plot_dist(data, ci=1.1)
 
+    # Should error on invalid style
+    with pytest.raises(ValueError):
+        pf.utils.plotting.plot_dist(data, style="asdf")
+
     pf.utils.plotting.plot_dist(data)
     if plot:
         plt.title("should be kde density (filled) of samples from norm dist")
@@ -244,6 +248,14 @@ def test_plot_by(plot):
     pf.utils.plotting.plot_by(x, data, func="median")
     pf.utils.plotting.plot_by(x, data, func="count")
 
+    # Should compute func for the data in each bin
+    _, means = pf.utils.plotting.plot_by(x, data, bins=5, bootstrap=None)
+    assert means.shape == (4,)
+    assert np.allclose(means[0], np.mean(data[x < 2.5]))
+    assert np.allclose(means[-1], np.mean(data[x >= 7.5]))
+    _, counts = pf.utils.plotting.plot_by(x, data, bins=5, func="count")
+    assert np.all(counts == 25)
+
     # Should plot mean data by x
     plt.clf()
     pf.utils.plotting.plot_by(x, data)
@@ -44,6 +44,25 @@ def test_datatype():
         settings.set_datatype("lala")
 
 
+def test_sample_datatype():
+    """Tests get and set_sample_datatype"""
+
+    assert settings.get_sample_datatype() is None
+
+    settings.set_sample_datatype(tf.bfloat16)
+    assert settings.get_sample_datatype() == tf.bfloat16
+    settings.set_sample_datatype(None)
+    assert settings.get_sample_datatype() is None
+
+    with pytest.raises(TypeError):
+        settings.set_sample_datatype("lala")
+
+    # Should be able to set via the Sampling context manager
+    with settings.Sampling(n=1, dtype=tf.float16):
+        assert settings.get_sample_datatype() == tf.float16
+    assert settings.get_sample_datatype() is None
+
+
 def test_samples():
     """Tests setting and getting the number of samples"""
 
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from probflow.parameters import Parameter
+from probflow.utils import validation
+from probflow.utils.validation import ensure_tensor_like
+
+
+def test_ensure_tensor_like():
+    """Tests probflow.utils.validation.ensure_tensor_like"""
+
+    # Should not raise for tensor-like objects
+    ensure_tensor_like(1, "a")
+    ensure_tensor_like(1.0, "a")
+    ensure_tensor_like([1.0, 2.0], "a")
+    ensure_tensor_like(np.array([1.0]), "a")
+    ensure_tensor_like(tf.constant([1.0]), "a")
+    ensure_tensor_like(tf.Variable([1.0]), "a")
+    ensure_tensor_like(Parameter(), "a")
+
+    # Should raise a TypeError otherwise
+    with pytest.raises(TypeError):
+        ensure_tensor_like("lala", "a")
+    with pytest.raises(TypeError):
+        ensure_tensor_like(None, "a")
+    with pytest.raises(TypeError):
+        ensure_tensor_like({"a": 1}, "a")
+
+
+def test_ensure_tensor_like_cached_types():
+    """Tests validated types are cached but subclasses are still checked"""
+
+    class MyArray(np.ndarray):
+        pass
+
+    ensure_tensor_like(np.array([1.0]), "a")
+    assert np.ndarray in validation._VALID_TYPES["tensorflow"]
+    ensure_tensor_like(np.array([1.0]).view(MyArray), "a")
+    assert MyArray in validation._VALID_TYPES["tensorflow"]
+
+    # Invalid types should never be cached
+    with pytest.raises(TypeError):
+        ensure_tensor_like("lala", "a")
+    assert str not in validation._VALID_TYPES["tensorflow"]